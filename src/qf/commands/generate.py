@@ -12,7 +12,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from qf.completions import complete_artifact_ids, complete_provider_names
 from qf.utils import find_project_file
 from qf.utils.providers import get_role_registry
-from qf.utils.workspace import QUESTFOUNDRY_AVAILABLE, get_workspace
+from qf.utils.workspace import get_workspace, is_questfoundry_available
 
 console = Console()
 
@@ -120,7 +120,7 @@ def execute_role_generation(
         typer.Exit: On error or missing dependencies
     """
     # Check dependency availability
-    if not QUESTFOUNDRY_AVAILABLE:
+    if not is_questfoundry_available():
         console.print(
             "\n[red]Error: questfoundry-py is not installed.[/red]\n"
             "[yellow]Install with:[/yellow] pip install questfoundry-py[openai]"
@@ -547,7 +547,7 @@ def generate_images(
     )
 
     # Real batch generation with questfoundry-py integration
-    if not QUESTFOUNDRY_AVAILABLE:
+    if not is_questfoundry_available():
         console.print(
             "\n[red]Error: questfoundry-py is not installed.[/red]\n"
             "[yellow]Install with:[/yellow] pip install questfoundry-py[openai]"
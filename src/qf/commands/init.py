@@ -5,13 +5,12 @@ import os
 from pathlib import Path
 from typing import Optional
 
-import questionary
 import typer
 from rich.console import Console
 from rich.panel import Panel
 
 from ..utils.formatting import print_header, print_success
-from ..utils.workspace import QUESTFOUNDRY_AVAILABLE
+from ..utils.workspace import is_questfoundry_available
 
 console = Console()
 
@@ -48,7 +47,7 @@ def create_project_structure(
     version: str = "0.1.0",
 ) -> None:
     """Create project directory structure using WorkspaceManager"""
-    if QUESTFOUNDRY_AVAILABLE:
+    if is_questfoundry_available():
         # Use questfoundry-py WorkspaceManager for proper SQLite database initialization
         from questfoundry.state import WorkspaceManager
 
@@ -167,6 +166,8 @@ def init_command(
 
     console.print("Setting up your new project...\n")
 
+    import questionary
+
     # Get project name (default to directory name)
     default_name = project_path.name
     project_name = questionary.text(
@@ -199,7 +200,7 @@ def init_command(
         console.print()
 
         # Show what was created
-        if QUESTFOUNDRY_AVAILABLE:
+        if is_questfoundry_available():
             database_info = "[cyan]Database:[/cyan] project.qfproj (SQLite)\n"
         else:
             database_info = f"[cyan]Metadata:[/cyan] {project_name}.qfproj (JSON)\n"
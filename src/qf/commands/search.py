@@ -27,8 +27,9 @@ def search_artifacts(
     if not workspace.exists():
         return results
 
-    # Escape query to treat special regex characters as literals
-    escaped_query = re.escape(query)
+    # Escape query to treat special regex characters as literals; compile once
+    # since it is matched against every artifact file
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
 
     # Search in hot and cold
     for status in ["hot", "cold"]:
@@ -55,12 +56,12 @@ def search_artifacts(
                     # Search in specified field or all fields
                     if field:
                         content = str(artifact.get(field, ""))
-                        if re.search(escaped_query, content, re.IGNORECASE):
+                        if pattern.search(content):
                             results.append(artifact)
                     else:
                         # Search in all fields
                         artifact_str = json.dumps(artifact)
-                        if re.search(escaped_query, artifact_str, re.IGNORECASE):
+                        if pattern.search(artifact_str):
                             results.append(artifact)
 
                 except (json.JSONDecodeError, OSError):
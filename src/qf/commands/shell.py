@@ -1,5 +1,6 @@
 """Interactive REPL shell for QuestFoundry commands"""
 
+from pathlib import Path
 
 import typer
 from rich.console import Console
@@ -12,11 +13,23 @@ console = Console()
 class QFShell:
     """Interactive shell for QuestFoundry commands"""
 
-    def __init__(self, verbose: bool = False, use_history: bool = True):
-        """Initialize shell session"""
+    def __init__(
+        self,
+        verbose: bool = False,
+        use_history: bool = True,
+        project_file: Path | None = None,
+    ):
+        """Initialize shell session
+
+        Args:
+            verbose: Show error details
+            use_history: Record entered commands
+            project_file: Project file already located by the caller; looked
+                up in the current directory when omitted
+        """
         self.verbose = verbose
         self.use_history = use_history
-        self.project_file = find_project_file()
+        self.project_file = project_file or find_project_file()
         self.running = True
         self.commands_history: list[str] = []
         # Define available QuestFoundry commands (used in help and validation)
@@ -187,5 +200,7 @@ def shell_command(
         console.print()
 
     # Create and run shell
-    shell = QFShell(verbose=verbose, use_history=not no_history)
+    shell = QFShell(
+        verbose=verbose, use_history=not no_history, project_file=project_file
+    )
     shell.run()
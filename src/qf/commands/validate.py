@@ -2,10 +2,11 @@
 
 import json
 import logging
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import jsonschema
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -14,6 +15,9 @@ from rich.table import Table
 from qf.commands.schema import get_schemas_path
 from qf.utils import find_project_file
 
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
+
 app = typer.Typer(help="Validate artifacts and envelopes")
 console = Console()
 logger = logging.getLogger(__name__)
@@ -71,6 +75,23 @@ def load_schema(schema_name: str) -> dict[str, Any]:
         raise SchemaValidationError(f"Error reading schema {schema_name}: {e}") from e
 
 
+@lru_cache(maxsize=32)
+def get_validator(schema_name: str) -> "Draft7Validator":
+    """
+    Build the validator for a schema, once per schema name.
+
+    Failed loads are not cached, so a missing schema is looked up again on
+    the next call.
+
+    Raises:
+        SchemaNotFoundError: If schema doesn't exist
+        SchemaValidationError: If schema is invalid
+    """
+    import jsonschema
+
+    return jsonschema.Draft7Validator(load_schema(schema_name))
+
+
 def validate_artifact_data(
     data: dict[str, Any], schema_name: str
 ) -> tuple[bool, list[str]]:
@@ -90,8 +111,11 @@ def validate_artifact_data(
         SchemaNotFoundError: If schema doesn't exist
         SchemaValidationError: If schema is invalid
     """
-    schema = load_schema(schema_name)
-    validator = jsonschema.Draft7Validator(schema)
+    validator = get_validator(schema_name)
+    # Valid data is the common case; only walk the error tree when it fails
+    if validator.is_valid(data):
+        return True, []
+
     errors = []
 
     for error in validator.iter_errors(data):
@@ -249,16 +273,24 @@ def validate_artifact(
 
 @app.command(name="file")
 def validate_file(
-    file_path: Path = typer.Argument(..., help="Path to JSON file"),
+    file_path: Path = typer.Argument(
+        ..., help="Path to JSON file, or '-' to read from stdin"
+    ),
     schema: str = typer.Option(
         ..., "--schema", "-s", help="Schema name to validate against"
     ),
 ) -> None:
     """Validate a JSON file against a schema"""
+    from_stdin = str(file_path) == "-"
+    source_name = "stdin" if from_stdin else file_path.name
+
     # Load file
     try:
-        with open(file_path) as f:
-            data = json.load(f)
+        if from_stdin:
+            data = json.load(sys.stdin)
+        else:
+            with open(file_path) as f:
+                data = json.load(f)
     except FileNotFoundError:
         console.print(f"[red]File not found: {file_path}[/red]")
         raise typer.Exit(1)
@@ -271,7 +303,7 @@ def validate_file(
 
     # Validate
     console.print(
-        f"\nValidating [cyan]{file_path.name}[/cyan] "
+        f"\nValidating [cyan]{source_name}[/cyan] "
         f"against schema [cyan]{schema}[/cyan]...\n"
     )
 
@@ -311,6 +343,67 @@ def validate_file(
         raise typer.Exit(1)
 
 
+@app.command(name="all")
+def validate_all() -> None:
+    """Validate every artifact in the workspace"""
+    project_file = find_project_file()
+    if not project_file:
+        console.print("[yellow]No project found in current directory[/yellow]")
+        console.print(
+            "\n[cyan]Tip:[/cyan] Run [green]qf init[/green] to create a new project"
+        )
+        raise typer.Exit(1)
+
+    hot_path = project_file.parent / ".questfoundry" / "hot"
+    artifact_files = sorted(hot_path.rglob("*.json")) if hot_path.is_dir() else []
+
+    # Validators are cached per schema, so each schema is compiled once
+    # however many artifacts share it
+    failures: list[tuple[str, str]] = []
+    for artifact_file in artifact_files:
+        name = artifact_file.relative_to(hot_path).as_posix()
+        try:
+            with open(artifact_file) as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            failures.append((name, f"Invalid JSON: {e}"))
+            continue
+        except OSError as e:
+            failures.append((name, f"Error reading file: {e}"))
+            continue
+
+        schema = data.get("type") if isinstance(data, dict) else None
+        if not schema:
+            failures.append((name, "No 'type' field"))
+            continue
+
+        try:
+            is_valid, errors = validate_artifact_data(data, schema)
+        except SchemaNotFoundError:
+            failures.append((name, f"Schema not found: {schema}"))
+            continue
+        except SchemaValidationError as e:
+            failures.append((name, f"Error loading schema: {e}"))
+            continue
+
+        if not is_valid:
+            # First error only, to keep one row per artifact
+            failures.append((name, errors[0]))
+
+    if failures:
+        error_table = Table(show_header=True)
+        error_table.add_column("Artifact", style="cyan")
+        error_table.add_column("Error", style="red")
+        for name, message in failures:
+            error_table.add_row(name, message)
+        console.print(error_table)
+
+    valid_count = len(artifact_files) - len(failures)
+    console.print(f"\n{valid_count} valid, {len(failures)} invalid")
+    if failures:
+        raise typer.Exit(1)
+
+
 @app.command(name="envelope")
 def validate_envelope(
     file_path: Path = typer.Argument(..., help="Envelope file path"),
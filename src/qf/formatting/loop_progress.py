@@ -9,8 +9,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+# Clock used for all timestamps; module-level so tests can substitute it
+_now = datetime.now
 
-@dataclass
+
+@dataclass(slots=True)
 class Step:
     """Represents a single step execution within an iteration."""
 
@@ -41,7 +44,7 @@ class Step:
         return "pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class Iteration:
     """Represents a single iteration of a loop."""
 
@@ -77,10 +80,33 @@ class Iteration:
     @property
     def first_pass_steps(self) -> int:
         """Count of first-pass steps in this iteration."""
-        return sum(1 for s in self.steps if not s.is_revision)
+        return len(self.steps) - self.revised_steps
+
+    def step_counts(self) -> dict[str, int]:
+        """All four step counts, gathered in a single pass over the steps.
+
+        Returns:
+            Dictionary keyed like the properties: completed_steps,
+            blocked_steps, revised_steps and first_pass_steps
+        """
+        completed = blocked = revised = 0
+        for step in self.steps:
+            status = step.status
+            if status == "completed":
+                completed += 1
+            elif status == "blocked":
+                blocked += 1
+            if step.is_revision:
+                revised += 1
+        return {
+            "completed_steps": completed,
+            "blocked_steps": blocked,
+            "revised_steps": revised,
+            "first_pass_steps": len(self.steps) - revised,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopProgressTracker:
     """Tracks multi-iteration loop execution with step-level detail.
 
@@ -99,7 +125,7 @@ class LoopProgressTracker:
 
     def start_loop(self) -> None:
         """Record loop start time."""
-        self.start_time = datetime.now()
+        self.start_time = _now()
 
     def start_iteration(self, iteration_number: int) -> Iteration:
         """Begin a new iteration.
@@ -111,7 +137,7 @@ class LoopProgressTracker:
             New Iteration object for this iteration
         """
         iteration = Iteration(
-            iteration_number=iteration_number, start_time=datetime.now()
+            iteration_number=iteration_number, start_time=_now()
         )
         self.iterations.append(iteration)
         self.current_iteration = iteration
@@ -137,7 +163,7 @@ class LoopProgressTracker:
             name=step_name,
             agent=agent,
             is_revision=is_revision,
-            start_time=datetime.now(),
+            start_time=_now(),
         )
         self.current_iteration.steps.append(step)
         return step
@@ -148,7 +174,7 @@ class LoopProgressTracker:
         Args:
             step: Step object to complete
         """
-        step.end_time = datetime.now()
+        step.end_time = _now()
 
     def block_step(self, step: Step, issues: list[str]) -> None:
         """Mark a step as blocked with specific issues.
@@ -159,7 +185,7 @@ class LoopProgressTracker:
         """
         step.blocked = True
         step.blocking_issues = issues
-        step.end_time = datetime.now()
+        step.end_time = _now()
 
     def record_showrunner_decision(self, decision: str) -> None:
         """Record Showrunner's decision for current iteration.
@@ -173,19 +199,19 @@ class LoopProgressTracker:
     def complete_iteration(self) -> None:
         """Mark current iteration as complete."""
         if self.current_iteration:
-            self.current_iteration.end_time = datetime.now()
+            self.current_iteration.end_time = _now()
 
     def mark_stabilized(self) -> None:
         """Mark the current iteration as achieving stability."""
         if self.current_iteration:
             self.current_iteration.stabilized = True
-            self.current_iteration.end_time = datetime.now()
+            self.current_iteration.end_time = _now()
 
     @property
     def total_duration(self) -> float:
         """Total duration from loop start to now."""
         if self.start_time:
-            return (datetime.now() - self.start_time).total_seconds()
+            return (_now() - self.start_time).total_seconds()
         return 0.0
 
     @property
@@ -216,10 +242,7 @@ class LoopProgressTracker:
             "iterations": [
                 {
                     "number": i.iteration_number,
-                    "completed_steps": i.completed_steps,
-                    "blocked_steps": i.blocked_steps,
-                    "revised_steps": i.revised_steps,
-                    "first_pass_steps": i.first_pass_steps,
+                    **i.step_counts(),
                     "duration": i.duration,
                     "stabilized": i.stabilized,
                     "showrunner_decision": i.showrunner_decision,
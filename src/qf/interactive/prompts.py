@@ -1,9 +1,9 @@
 """User prompts and questions for interactive mode."""
 
 import sys
+from types import ModuleType
 from typing import Optional
 
-import questionary
 from rich.console import Console
 
 # Initialize Console defensively for non-TTY environments
@@ -12,6 +12,17 @@ console = Console(
 )
 
 
+def _questionary() -> ModuleType:
+    """Import questionary on first use.
+
+    It pulls in prompt_toolkit, which is slow to import and only needed once
+    a prompt is actually shown.
+    """
+    import questionary
+
+    return questionary
+
+
 def _is_interactive() -> bool:
     """Check if we're in an interactive TTY environment.
 
@@ -41,7 +52,7 @@ def ask_premise() -> str:
             "Please run 'qf quickstart' in an interactive terminal."
         )
 
-    return questionary.text(
+    return _questionary().text(
         "What is your story premise?",
         validate=lambda x: len(x) >= 10 or "Please provide at least 10 characters",
     ).ask() or ""
@@ -62,7 +73,7 @@ def ask_tone() -> str:
             "Please run 'qf quickstart' in an interactive terminal."
         )
 
-    return questionary.select(
+    return _questionary().select(
         "What tone or genre?",
         choices=[
             "Mystery",
@@ -92,7 +103,7 @@ def ask_length() -> str:
             "Please run 'qf quickstart' in an interactive terminal."
         )
 
-    return questionary.select(
+    return _questionary().select(
         "How long should the story be?",
         choices=[
             "Short Story (5-20 pages)",
@@ -123,7 +134,7 @@ def ask_project_name(premise: str) -> str:
     # Create a default name from premise
     default_name = "-".join(premise.split()[:3]).lower()[:30]
 
-    return questionary.text(
+    return _questionary().text(
         "Project name",
         default=default_name,
         validate=lambda x: len(x) >= 3 or "Name must be at least 3 characters",
@@ -159,7 +170,7 @@ def confirm_setup(premise: str, tone: str, length: str, name: str) -> bool:
     console.print(f"[cyan]Tone:[/cyan] {tone}")
     console.print(f"[cyan]Length:[/cyan] {length}")
 
-    return questionary.confirm(
+    return _questionary().confirm(
         "Create project?",
         auto_enter=True,
         default=True,
@@ -181,7 +192,7 @@ def ask_review_artifacts() -> bool:
             "Please run 'qf quickstart' in an interactive terminal."
         )
 
-    return questionary.confirm(
+    return _questionary().confirm(
         "Review artifacts?",
         auto_enter=True,
         default=False,
@@ -206,7 +217,7 @@ def ask_continue_loop(next_loop: str) -> bool:
             "Please run 'qf quickstart' in an interactive terminal."
         )
 
-    return questionary.confirm(
+    return _questionary().confirm(
         f"Continue with {next_loop}?",
         auto_enter=True,
         default=True,
@@ -235,13 +246,13 @@ def ask_agent_response(question: str, suggestions: Optional[list[str]] = None) -
     if suggestions:
         # Show suggestions as a select menu
         choices = suggestions + ["Other (type custom response)"]
-        response = questionary.select(
+        response = _questionary().select(
             question,
             choices=choices,
         ).ask()
 
         if response == "Other (type custom response)":
-            return questionary.text(
+            return _questionary().text(
                 "Your response:",
                 validate=lambda x: len(x) > 0 or "Response cannot be empty",
             ).ask() or ""
@@ -249,7 +260,7 @@ def ask_agent_response(question: str, suggestions: Optional[list[str]] = None) -
         return response or ""
     else:
         # Free-form text input
-        return questionary.text(
+        return _questionary().text(
             question,
             validate=lambda x: len(x) > 0 or "Response cannot be empty",
         ).ask() or ""
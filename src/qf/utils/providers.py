@@ -1,23 +1,16 @@
 """Provider and role registry utilities for questfoundry-py integration"""
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from rich.console import Console
 
-try:
+from qf.utils.workspace import get_spec_path, is_questfoundry_available
+
+if TYPE_CHECKING:
     from questfoundry.providers import ProviderConfig, ProviderRegistry
     from questfoundry.roles import RoleRegistry
 
-    QUESTFOUNDRY_AVAILABLE = True
-except ImportError:
-    QUESTFOUNDRY_AVAILABLE = False
-    ProviderConfig = type("ProviderConfig", (), {})  # type: ignore[assignment]
-    ProviderRegistry = type("ProviderRegistry", (), {})  # type: ignore[assignment]
-    RoleRegistry = type("RoleRegistry", (), {})  # type: ignore[assignment]
-
-from qf.utils.workspace import get_spec_path
-
 console = Console()
 
 
@@ -34,12 +27,14 @@ def get_provider_config(config_path: Optional[Path] = None) -> "ProviderConfig":
     Raises:
         RuntimeError: If questfoundry-py is not installed
     """
-    if not QUESTFOUNDRY_AVAILABLE:
+    if not is_questfoundry_available():
         raise RuntimeError(
             "questfoundry-py library is not installed. "
             "Install with: pip install questfoundry-py[openai]"
         )
 
+    from questfoundry.providers import ProviderConfig
+
     if config_path:
         return ProviderConfig(config_path=config_path)
     return ProviderConfig()
@@ -60,12 +55,14 @@ def get_provider_registry(
     Raises:
         RuntimeError: If questfoundry-py is not installed
     """
-    if not QUESTFOUNDRY_AVAILABLE:
+    if not is_questfoundry_available():
         raise RuntimeError(
             "questfoundry-py library is not installed. "
             "Install with: pip install questfoundry-py[openai]"
         )
 
+    from questfoundry.providers import ProviderRegistry
+
     if config is None:
         config = get_provider_config()
 
@@ -91,12 +88,14 @@ def get_role_registry(
         RuntimeError: If questfoundry-py is not installed
         RuntimeError: If spec directory cannot be found
     """
-    if not QUESTFOUNDRY_AVAILABLE:
+    if not is_questfoundry_available():
         raise RuntimeError(
             "questfoundry-py library is not installed. "
             "Install with: pip install questfoundry-py[openai]"
         )
 
+    from questfoundry.roles import RoleRegistry
+
     if provider_registry is None:
         provider_registry = get_provider_registry()
 
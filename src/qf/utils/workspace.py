@@ -1,21 +1,38 @@
 """Workspace utility functions for questfoundry-py integration"""
 
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from rich.console import Console
 
-try:
+if TYPE_CHECKING:
     from questfoundry.state import WorkspaceManager
 
-    QUESTFOUNDRY_AVAILABLE = True
-except ImportError:
-    QUESTFOUNDRY_AVAILABLE = False
-    WorkspaceManager = type("WorkspaceManager", (), {})  # type: ignore[assignment]
-
 console = Console()
 
 
+@cache
+def is_questfoundry_available() -> bool:
+    """
+    Check whether questfoundry-py is installed and imports cleanly.
+
+    Checked on first use rather than at module import, so the library and
+    its dependencies only load for commands that need them. An installed
+    but broken library counts as unavailable.
+
+    Returns:
+        True if questfoundry-py can be used, False otherwise
+    """
+    try:
+        import questfoundry.providers  # noqa: F401
+        import questfoundry.roles  # noqa: F401
+        import questfoundry.state  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def find_project_root(start_path: Optional[Path] = None) -> Optional[Path]:
     """
     Find the project root by looking for .questfoundry directory.
@@ -55,7 +72,7 @@ def get_workspace(path: Optional[Path] = None) -> "WorkspaceManager":
         RuntimeError: If questfoundry-py is not installed
         RuntimeError: If not in a QuestFoundry project
     """
-    if not QUESTFOUNDRY_AVAILABLE:
+    if not is_questfoundry_available():
         raise RuntimeError(
             "questfoundry-py library is not installed. "
             "Install with: pip install questfoundry-py[openai]"
@@ -68,6 +85,8 @@ def get_workspace(path: Optional[Path] = None) -> "WorkspaceManager":
             "Run 'qf init' to create a new project."
         )
 
+    from questfoundry.state import WorkspaceManager
+
     return WorkspaceManager(project_root)
 
 
@@ -0,0 +1,17 @@
+"""Assertion helpers shared by command tests"""
+
+
+def assert_any_in(output, *needles):
+    """Assert that `output` contains at least one needle, ignoring case"""
+    lowered = output.lower()
+    assert any(needle.lower() in lowered for needle in needles), output
+
+
+def assert_all_in(output, *needles):
+    """Assert that `output` contains every needle, ignoring case
+
+    Reports all of the missing needles at once rather than the first.
+    """
+    lowered = output.lower()
+    missing = [needle for needle in needles if needle.lower() not in lowered]
+    assert not missing, missing
@@ -1,20 +1,146 @@
 """Shared test fixtures"""
 
+import json
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import click
 import pytest
 import questionary
 
+from qf.cli import app
+from tests.runner import CachedCliRunner, get_command
+
+# Complete codex entry with `id` and `type`, valid against `codex_entry`
+CODEX_ENTRY = Path(__file__).parent.parent / "fixtures" / "codex_entry.json"
+
+
+# Canned answers keyed by a substring of the prompt message
+PROMPT_ANSWERS = {"name": "test-project", "description": "Test description"}
+
+
+def answer_prompt(message, **kwargs):
+    """Stand in for questionary prompts so commands answer themselves.
+
+    Only `.ask()` is ever called on the result, so no real prompt is built.
+    Prompts without a canned answer take their default.
+    """
+    prompt = message.lower()
+    answer = next(
+        (answer for key, answer in PROMPT_ANSWERS.items() if key in prompt),
+        kwargs.get("default", ""),
+    )
+    return SimpleNamespace(ask=lambda: answer)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_questionary():
+    """Replace questionary prompts with `answer_prompt` for the whole session.
+
+    CliRunner has no TTY, so a real prompt could never be answered anyway.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for prompt_type in ("text", "select", "confirm"):
+            mp.setattr(questionary, prompt_type, answer_prompt)
+        yield
+
+
+@pytest.fixture(scope="session")
+def initialized_template(tmp_path_factory, fast_questionary):
+    """Run the real `qf init` once per session and keep the result as a template"""
+    template = tmp_path_factory.mktemp("initialized_project")
+    result = CachedCliRunner().invoke(app, ["init", str(template)])
+    assert result.exit_code == 0, result.stdout
+    return template
+
+
+@pytest.fixture
+def initialized_project(tmp_path, monkeypatch, initialized_template):
+    """Copy the `qf init` template into `tmp_path` and chdir into it.
+
+    Use this instead of invoking `qf init` when the test is not about `init`
+    itself. Since the template comes from a real `init` run, it reflects
+    whatever `init` produces in the current environment, e.g. the SQLite
+    workspace when questfoundry-py is installed.
+    """
+    shutil.copytree(initialized_template, tmp_path, dirs_exist_ok=True)
+    relocate_layers(tmp_path, initialized_template)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def relocate_layers(project, template):
+    """Point the copied JSON metadata's absolute `layers` paths at `project`.
+
+    `init` records them under the template directory; left alone, every copy
+    would share the template's workspace. The SQLite metadata written when
+    questfoundry-py is installed is not JSON and is left untouched.
+    """
+    for project_file in project.glob("*.qfproj"):
+        try:
+            metadata = json.loads(project_file.read_text())
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+        metadata["layers"] = {
+            layer: str(project / Path(path).relative_to(template))
+            for layer, path in metadata["layers"].items()
+        }
+        project_file.write_text(json.dumps(metadata, indent=2))
+
+
+@pytest.fixture(scope="session")
+def codex_entry_bytes():
+    """Raw bytes of the valid codex entry fixture, read once per session"""
+    return CODEX_ENTRY.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def hooks_workspace_template(tmp_path_factory):
+    """Bare project skeleton: an empty `.qfproj` and the hot hooks/loops dirs"""
+    template = tmp_path_factory.mktemp("hooks_workspace")
+    (template / ".qfproj").write_text("{}")
+    for subdir in ("hot/hooks", "hot/loops"):
+        (template / ".questfoundry" / subdir).mkdir(parents=True)
+    return template
+
 
 @pytest.fixture
-def mock_questionary_init(monkeypatch):
-    """Mock questionary.text for project initialization"""
-    original_text = questionary.text
-
-    def mock_text(message, **kwargs):
-        result = original_text(message, **kwargs)
-        if "name" in message.lower():
-            result.ask = lambda: "test-project"
-        elif "description" in message.lower():
-            result.ask = lambda: "Test description"
-        return result
-
-    monkeypatch.setattr(questionary, "text", mock_text)
+def hooks_workspace(tmp_path, monkeypatch, hooks_workspace_template):
+    """Copy the bare project skeleton into `tmp_path` and chdir into it"""
+    shutil.copytree(hooks_workspace_template, tmp_path, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cli_command():
+    """Build the Click command tree for `app` once per session.
+
+    Doing it up front pays for subcommand imports and registration before
+    the first test rather than inside whichever test happens to run first;
+    `CachedCliRunner` then invokes this same tree.
+    """
+    return get_command(app)
+
+
+@pytest.fixture(scope="session")
+def help_text(cli_command):
+    """Render a command's help text without going through `CliRunner.invoke`.
+
+    Typer's Rich help formatter prints straight to the console, so the plain
+    Click formatter is used instead; it carries the same usage, help text
+    and option names that the tests assert on.
+    """
+
+    def get_help(*path):
+        ctx = click.Context(cli_command, info_name="qf")
+        for name in path:
+            command = ctx.command.get_command(ctx, name)
+            ctx = click.Context(command, parent=ctx, info_name=name)
+        formatter = ctx.make_formatter()
+        base = click.Group if isinstance(ctx.command, click.Group) else click.Command
+        base.format_help(ctx.command, ctx, formatter)
+        return formatter.getvalue()
+
+    return get_help
@@ -1,20 +1,19 @@
 """Tests for qf bind commands (view binding/rendering)."""
 
-from typer.testing import CliRunner
-
 from qf.cli import app
+from tests.commands.assertions import assert_any_in
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 class TestBindViewCommand:
     """Tests for qf bind view subcommand."""
 
-    def test_bind_view_help(self):
+    def test_bind_view_help(self, help_text):
         """Test that bind view command help is available."""
-        result = runner.invoke(app, ["bind", "view", "--help"])
-        assert result.exit_code == 0
-        assert "bind" in result.stdout.lower() or "view" in result.stdout.lower()
+        help_output = help_text("bind", "view").lower()
+        assert "bind" in help_output or "view" in help_output
 
     def test_bind_view_requires_project(self, tmp_path, monkeypatch):
         """Test bind view requires an initialized project."""
@@ -23,86 +22,50 @@ class TestBindViewCommand:
         result = runner.invoke(app, ["bind", "view", "snapshot-123"])
 
         assert result.exit_code != 0
-        assert (
-            "project" in result.stdout.lower()
-            or "not found" in result.stdout.lower()
-        )
+        assert_any_in(result.stdout, "project", "not found")
 
-    def test_bind_view_requires_snapshot_id(
-        self, tmp_path, monkeypatch, mock_questionary_init
-    ):
+    def test_bind_view_requires_snapshot_id(self, initialized_project):
         """Test bind view requires a snapshot ID."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         # Try without snapshot ID
         result = runner.invoke(app, ["bind", "view"])
 
         assert result.exit_code != 0
 
-    def test_bind_view_html_format(self, tmp_path, monkeypatch, mock_questionary_init):
+    def test_bind_view_html_format(self, initialized_project):
         """Test binding view to HTML format."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         # Bind view to HTML
         result = runner.invoke(
-            app, ["bind", "view", "snapshot-123", "--format", "html"]
+            app, ["bind", "view", "snapshot-123", "--format", "html"],
+            catch_exceptions=False,
         )
 
         assert result.exit_code == 0
         assert "View bound successfully" in result.stdout
 
-    def test_bind_view_markdown_format(
-        self, tmp_path, monkeypatch, mock_questionary_init
-    ):
+    def test_bind_view_markdown_format(self, initialized_project):
         """Test binding view to Markdown format."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         # Bind view to Markdown
         result = runner.invoke(
-            app, ["bind", "view", "snapshot-123", "--format", "markdown"]
+            app, ["bind", "view", "snapshot-123", "--format", "markdown"],
+            catch_exceptions=False,
         )
 
         assert result.exit_code == 0
         assert "View bound successfully" in result.stdout
 
-    def test_bind_view_pdf_format(self, tmp_path, monkeypatch, mock_questionary_init):
+    def test_bind_view_pdf_format(self, initialized_project):
         """Test binding view to PDF format."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         # Bind view to PDF
         result = runner.invoke(
-            app, ["bind", "view", "snapshot-123", "--format", "pdf"]
+            app, ["bind", "view", "snapshot-123", "--format", "pdf"],
+            catch_exceptions=False,
         )
 
         assert result.exit_code == 0
         assert "View bound successfully" in result.stdout
 
-    def test_bind_view_with_output_path(
-        self, tmp_path, monkeypatch, mock_questionary_init
-    ):
+    def test_bind_view_with_output_path(self, tmp_path, initialized_project):
         """Test binding view to custom output path."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         output_dir = tmp_path / "binds"
         output_dir.mkdir()
 
@@ -116,21 +79,14 @@ class TestBindViewCommand:
                 "--output",
                 str(output_dir / "bound-view.html"),
             ],
+            catch_exceptions=False,
         )
 
         assert result.exit_code == 0
         assert "View bound successfully" in result.stdout
 
-    def test_bind_view_invalid_format(
-        self, tmp_path, monkeypatch, mock_questionary_init
-    ):
+    def test_bind_view_invalid_format(self, initialized_project):
         """Test that invalid format is rejected."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         # Try invalid format
         result = runner.invoke(
             app, ["bind", "view", "snapshot-123", "--format", "invalid"]
@@ -139,34 +95,22 @@ class TestBindViewCommand:
         assert result.exit_code != 0
         assert "Invalid format" in result.stdout
 
-    def test_bind_view_shows_progress(
-        self, tmp_path, monkeypatch, mock_questionary_init
-    ):
+    def test_bind_view_shows_progress(self, initialized_project):
         """Test that bind displays progress."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         # Bind view
-        result = runner.invoke(app, ["bind", "view", "snapshot-123"])
+        result = runner.invoke(
+            app, ["bind", "view", "snapshot-123"], catch_exceptions=False
+        )
 
         assert result.exit_code == 0
         assert "View bound successfully" in result.stdout
 
-    def test_bind_view_default_format(
-        self, tmp_path, monkeypatch, mock_questionary_init
-    ):
+    def test_bind_view_default_format(self, initialized_project):
         """Test bind view uses sensible default format."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        result = runner.invoke(app, ["init"])
-        assert result.exit_code == 0
-
         # Bind without specifying format (should use default)
-        result = runner.invoke(app, ["bind", "view", "snapshot-123"])
+        result = runner.invoke(
+            app, ["bind", "view", "snapshot-123"], catch_exceptions=False
+        )
 
         assert result.exit_code == 0
         assert "View bound successfully" in result.stdout
@@ -2,11 +2,10 @@
 
 import json
 
-from typer.testing import CliRunner
-
 from qf.cli import app
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 def test_check_without_project(tmp_path, monkeypatch):
@@ -19,14 +18,8 @@ def test_check_without_project(tmp_path, monkeypatch):
     assert "No project found" in result.stdout
 
 
-def test_check_empty_project(tmp_path, monkeypatch, mock_questionary_init):
+def test_check_empty_project(initialized_project):
     """Test running checks on an empty project"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Run checks
     result = runner.invoke(app, ["check", "run"])
 
@@ -35,58 +28,15 @@ def test_check_empty_project(tmp_path, monkeypatch, mock_questionary_init):
     assert "passed" in result.stdout.lower()
 
 
-def test_check_with_valid_artifacts(tmp_path, monkeypatch, mock_questionary_init):
+def test_check_with_valid_artifacts(
+    tmp_path, initialized_project, codex_entry_bytes
+):
     """Test running checks with valid artifacts"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Create valid codex entry
     workspace = tmp_path / ".questfoundry"
     codex_dir = workspace / "hot" / "codex"
     codex_dir.mkdir(parents=True, exist_ok=True)
-
-    artifact = {
-        "id": "test-entry",
-        "type": "codex_entry",
-        "title": "Test Entry",
-        "slug": "test-entry",
-        "locale": "EN",
-        "owner": "Codex Curator",
-        "edited": "2025-11-07",
-        "snapshot": "Cold @ 2025-11-04",
-        "tu": "TU-2025-11-07-CC01",
-        "lineage": "From canon TU-2025-11-03-LW10; posture plausible",
-        "overview": "A test codex entry for validation testing purposes",
-        "context": "This entry is used to validate the schema validation system",
-        "variants": [
-            {
-                "variant": "Test Variant",
-                "register_region": "neutral",
-                "translator_notes": "Translation note for testing"
-            }
-        ],
-        "relations": ["test-relation"],
-        "reading_level": "plain",
-        "anchor_slug": "/codex/test-entry",
-        "from_canon": "Test canon description for validation",
-        "research_posture_touched": "plausible",
-        "done_checklist": [
-            "Player-safe",
-            "Links resolve",
-            "Variants listed",
-            "Relations noted",
-            "Register chosen",
-            "Anchor set",
-            "Canon distilled",
-            "Posture logged"
-        ]
-    }
-
-    with open(codex_dir / "test-entry.json", "w") as f:
-        json.dump(artifact, f)
+    (codex_dir / "test-entry.json").write_bytes(codex_entry_bytes)
 
     # Run checks
     result = runner.invoke(app, ["check", "run"])
@@ -96,14 +46,8 @@ def test_check_with_valid_artifacts(tmp_path, monkeypatch, mock_questionary_init
     assert "PASS" in result.stdout
 
 
-def test_check_with_invalid_json(tmp_path, monkeypatch, mock_questionary_init):
+def test_check_with_invalid_json(tmp_path, initialized_project):
     """Test running checks with invalid JSON"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Create invalid JSON file
     workspace = tmp_path / ".questfoundry"
     hooks_dir = workspace / "hot" / "hooks"
@@ -120,16 +64,8 @@ def test_check_with_invalid_json(tmp_path, monkeypatch, mock_questionary_init):
     assert "FAIL" in result.stdout
 
 
-def test_check_with_missing_required_fields(
-    tmp_path, monkeypatch, mock_questionary_init
-):
+def test_check_with_missing_required_fields(tmp_path, initialized_project):
     """Test running checks with missing required fields"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Create artifact without required fields
     workspace = tmp_path / ".questfoundry"
     hooks_dir = workspace / "hot" / "hooks"
@@ -150,14 +86,8 @@ def test_check_with_missing_required_fields(
     assert "FAIL" in result.stdout
 
 
-def test_check_with_specific_bars(tmp_path, monkeypatch, mock_questionary_init):
+def test_check_with_specific_bars(initialized_project):
     """Test running specific quality bars"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Run specific bars
     result = runner.invoke(app, ["check", "run", "--bars", "integrity,required"])
 
@@ -166,14 +96,8 @@ def test_check_with_specific_bars(tmp_path, monkeypatch, mock_questionary_init):
     assert "Required Fields" in result.stdout
 
 
-def test_check_with_invalid_bar_name(tmp_path, monkeypatch, mock_questionary_init):
+def test_check_with_invalid_bar_name(initialized_project):
     """Test running checks with invalid bar name"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Try to run invalid bar
     result = runner.invoke(app, ["check", "run", "--bars", "nonexistent"])
 
@@ -181,14 +105,8 @@ def test_check_with_invalid_bar_name(tmp_path, monkeypatch, mock_questionary_ini
     assert "Invalid quality bars" in result.stdout
 
 
-def test_check_verbose_shows_errors(tmp_path, monkeypatch, mock_questionary_init):
+def test_check_verbose_shows_errors(tmp_path, initialized_project):
     """Test that verbose mode shows detailed errors"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Create artifact without required fields
     workspace = tmp_path / ".questfoundry"
     hooks_dir = workspace / "hot" / "hooks"
@@ -207,14 +125,8 @@ def test_check_verbose_shows_errors(tmp_path, monkeypatch, mock_questionary_init
     assert "incomplete.json" in result.stdout
 
 
-def test_check_naming_convention_mismatch(tmp_path, monkeypatch, mock_questionary_init):
+def test_check_naming_convention_mismatch(tmp_path, initialized_project):
     """Test check fails when filename doesn't match artifact ID"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Create artifact with mismatched filename and ID
     workspace = tmp_path / ".questfoundry"
     codex_dir = workspace / "hot" / "codex"
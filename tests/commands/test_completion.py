@@ -1,12 +1,39 @@
 """Tests for shell completion functionality."""
 
-import time
+import re
+from time import perf_counter
 
-from typer.testing import CliRunner
+import pytest
 
 from qf.cli import app
-
-runner = CliRunner()
+from qf.completions.dynamic import (
+    complete_artifact_ids,
+    complete_loop_names,
+    complete_provider_names,
+)
+from tests.runner import CachedCliRunner
+
+runner = CachedCliRunner()
+
+SHELLS = ["bash", "zsh", "fish"]
+
+COMPLETION_MARKER = re.compile(r"_qf_completion|complete", re.IGNORECASE)
+INSTALL_MARKERS = {
+    shell: re.compile(rf"{shell}|installed", re.IGNORECASE) for shell in SHELLS
+}
+
+
+@pytest.fixture(scope="module")
+def completion_scripts():
+    """Generate each shell's completion script once for the whole module."""
+    scripts = {}
+    for shell in SHELLS:
+        result = runner.invoke(
+            app, ["--show-completion", shell], catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        scripts[shell] = result.stdout
+    return scripts
 
 
 class TestCompletionCommands:
@@ -14,29 +41,18 @@ class TestCompletionCommands:
 
     def test_show_completion_help(self):
         """Test that --show-completion help is available."""
-        result = runner.invoke(app, ["--show-completion", "--help"])
+        result = runner.invoke(
+            app, ["--show-completion", "--help"], catch_exceptions=False
+        )
         assert result.exit_code == 0
         assert "completion" in result.stdout.lower()
 
-    def test_show_completion_bash(self):
-        """Test showing bash completion script."""
-        result = runner.invoke(app, ["--show-completion", "bash"])
-        assert result.exit_code == 0
-        assert "bash" in result.stdout.lower() or "_qf" in result.stdout
-
-    def test_show_completion_zsh(self):
-        """Test showing zsh completion script."""
-        result = runner.invoke(app, ["--show-completion", "zsh"])
-        # Typer generates bash format for zsh, so accept that
-        assert result.exit_code == 0
-        assert "_qf_completion" in result.stdout or "complete" in result.stdout
-
-    def test_show_completion_fish(self):
-        """Test showing fish completion script."""
-        result = runner.invoke(app, ["--show-completion", "fish"])
-        # Typer generates bash format for fish shells, so accept that
-        assert result.exit_code == 0
-        assert "_qf_completion" in result.stdout or "complete" in result.stdout
+    @pytest.mark.parametrize("shell", SHELLS)
+    def test_show_completion(self, shell, completion_scripts):
+        """Test showing the completion script for each supported shell."""
+        script = completion_scripts[shell]
+        # Typer may generate bash format for zsh and fish, so accept that
+        assert COMPLETION_MARKER.search(script)
 
     def test_show_completion_invalid_shell(self):
         """Test invalid shell raises error."""
@@ -47,48 +63,37 @@ class TestCompletionCommands:
 
     def test_install_completion_help(self):
         """Test that --install-completion help is available."""
-        result = runner.invoke(app, ["--install-completion", "--help"])
+        result = runner.invoke(
+            app, ["--install-completion", "--help"], catch_exceptions=False
+        )
         assert result.exit_code == 0
         assert "completion" in result.stdout.lower()
 
-    def test_install_completion_bash(self, tmp_path, monkeypatch):
-        """Test installing bash completion."""
-        # Mock the bashrc file
-        bashrc = tmp_path / ".bashrc"
-        bashrc.touch()
+    @pytest.mark.parametrize(
+        "shell,rc_path",
+        [
+            ("bash", ".bashrc"),
+            ("zsh", ".zshrc"),
+            ("fish", ".config/fish/completions/"),
+        ],
+    )
+    def test_install_completion(self, shell, rc_path, tmp_path, monkeypatch):
+        """Test installing completion for each supported shell."""
+        # Mock the shell's rc file, or its completions directory for fish
+        target = tmp_path / rc_path
+        if rc_path.endswith("/"):
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.touch()
         monkeypatch.setenv("HOME", str(tmp_path))
 
-        result = runner.invoke(app, ["--install-completion", "bash"])
+        result = runner.invoke(
+            app, ["--install-completion", shell], catch_exceptions=False
+        )
 
         # Should complete successfully with installation message
         assert result.exit_code == 0
-        assert "bash" in result.stdout.lower() or "installed" in result.stdout.lower()
-
-    def test_install_completion_zsh(self, tmp_path, monkeypatch):
-        """Test installing zsh completion."""
-        # Mock the zshrc file
-        zshrc = tmp_path / ".zshrc"
-        zshrc.touch()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        result = runner.invoke(app, ["--install-completion", "zsh"])
-
-        # Should complete successfully with installation message
-        assert result.exit_code == 0
-        assert "zsh" in result.stdout.lower() or "installed" in result.stdout.lower()
-
-    def test_install_completion_fish(self, tmp_path, monkeypatch):
-        """Test installing fish completion."""
-        # Mock fish completion directory
-        fish_dir = tmp_path / ".config" / "fish" / "completions"
-        fish_dir.mkdir(parents=True, exist_ok=True)
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        result = runner.invoke(app, ["--install-completion", "fish"])
-
-        # Should complete successfully with installation message
-        assert result.exit_code == 0
-        assert "fish" in result.stdout.lower() or "installed" in result.stdout.lower()
+        assert INSTALL_MARKERS[shell].search(result.stdout)
 
 
 class TestDynamicCompletion:
@@ -96,8 +101,6 @@ class TestDynamicCompletion:
 
     def test_artifact_id_completion_no_project(self):
         """Test artifact ID completion returns empty when no project."""
-        from qf.completions.dynamic import complete_artifact_ids
-
         # Should not raise error even without project
         result = complete_artifact_ids(incomplete="snap")
         assert isinstance(result, list)
@@ -111,8 +114,6 @@ class TestDynamicCompletion:
         (tmp_path / ".qfproj").touch()
 
         # Now test completion
-        from qf.completions.dynamic import complete_artifact_ids
-
         completions = complete_artifact_ids(incomplete="")
         assert isinstance(completions, list)
         # Should return list with common patterns when no artifacts exist
@@ -120,8 +121,6 @@ class TestDynamicCompletion:
 
     def test_provider_name_completion(self):
         """Test provider name completion."""
-        from qf.completions.dynamic import complete_provider_names
-
         result = complete_provider_names(incomplete="")
         assert isinstance(result, list)
         # Provider list should not be empty (has default providers)
@@ -129,8 +128,6 @@ class TestDynamicCompletion:
 
     def test_loop_name_completion_no_project(self):
         """Test loop name completion returns empty when no project."""
-        from qf.completions.dynamic import complete_loop_names
-
         result = complete_loop_names(incomplete="")
         assert isinstance(result, list)
 
@@ -142,8 +139,6 @@ class TestDynamicCompletion:
         (tmp_path / ".qfproj").touch()
 
         # Now test completion
-        from qf.completions.dynamic import complete_loop_names
-
         completions = complete_loop_names(incomplete="")
         assert isinstance(completions, list)
 
@@ -151,65 +146,34 @@ class TestDynamicCompletion:
 class TestCompletionIntegration:
     """Tests for completion integration with existing commands."""
 
-    def test_generate_command_has_completion(self):
+    def test_generate_command_has_completion(self, help_text):
         """Test that generate command has completion support."""
         # Generate command should accept artifact ID completion
-        result = runner.invoke(app, ["generate", "--help"])
-        assert result.exit_code == 0
-        assert "artifact" in result.stdout.lower() or "loop" in result.stdout.lower()
+        help_output = help_text("generate").lower()
+        assert "artifact" in help_output or "loop" in help_output
 
-    def test_run_command_has_completion(self):
+    def test_run_command_has_completion(self, help_text):
         """Test that run command has completion support."""
-        result = runner.invoke(app, ["run", "--help"])
-        assert result.exit_code == 0
-        # Run command should have help available
+        assert "LOOP_NAME" in help_text("run")
 
-    def test_show_command_has_completion(self):
+    def test_show_command_has_completion(self, help_text):
         """Test that show command has completion support."""
-        result = runner.invoke(app, ["show", "--help"])
-        assert result.exit_code == 0
-        # Show command should have help available
+        assert "ARTIFACT_ID" in help_text("show")
 
 
 class TestCompletionScripts:
     """Tests for completion script generation and content."""
 
-    def test_bash_completion_script_structure(self):
-        """Test bash completion script has proper structure."""
-        result = runner.invoke(app, ["--show-completion", "bash"])
-        assert result.exit_code == 0
-
-        # Check for bash-specific completion markers
-        script = result.stdout
+    @pytest.mark.parametrize("shell", SHELLS)
+    def test_completion_script_structure(self, shell, completion_scripts):
+        """Test each completion script defines a completion function for qf."""
+        script = completion_scripts[shell]
         # Should contain function or completion definition
-        assert "_qf" in script or "qf" in script
-
-    def test_zsh_completion_script_structure(self):
-        """Test zsh completion script has proper structure."""
-        result = runner.invoke(app, ["--show-completion", "zsh"])
-        assert result.exit_code == 0
-
-        # Check for zsh-specific completion markers or at least bash completion function
-        script = result.stdout
-        # Typer generates bash completion for all shells
-        assert "_qf_completion" in script or "complete" in script
+        assert "_qf" in script or "complete" in script
 
-    def test_fish_completion_script_structure(self):
-        """Test fish completion script has proper structure."""
-        result = runner.invoke(app, ["--show-completion", "fish"])
-        assert result.exit_code == 0
-
-        # Check for fish-specific completion markers or bash completion function
-        script = result.stdout
-        # Typer generates bash completion for all shells
-        assert "_qf_completion" in script or "complete" in script
-
-    def test_completion_script_includes_commands(self):
+    def test_completion_script_includes_commands(self, completion_scripts):
         """Test that completion scripts include main commands."""
-        result = runner.invoke(app, ["--show-completion", "bash"])
-        assert result.exit_code == 0
-
-        script = result.stdout
+        script = completion_scripts["bash"]
         # Should include completion function for qf
         assert "_qf_completion" in script or "qf" in script
 
@@ -217,30 +181,23 @@ class TestCompletionScripts:
 class TestCompletionPerformance:
     """Tests for completion performance."""
 
-    def test_completion_completes_quickly(self, tmp_path, monkeypatch):
+    def test_completion_completes_quickly(self, initialized_project, record_property):
         """Test that completion functions complete within timeout."""
-        monkeypatch.chdir(tmp_path)
-
-        # Initialize project
-        runner.invoke(app, ["init"], input="test-project\nTest project\n")
-
-        from qf.completions.dynamic import complete_artifact_ids
-
         # Should complete within 200ms
-        start = time.time()
+        start = perf_counter()
         result = complete_artifact_ids(incomplete="snap")
-        elapsed = time.time() - start
+        elapsed = perf_counter() - start
+        record_property("elapsed_seconds", elapsed)
 
         assert isinstance(result, list)
         assert elapsed < 0.5  # Allow up to 500ms for safety margin
 
-    def test_provider_completion_completes_quickly(self):
+    def test_provider_completion_completes_quickly(self, record_property):
         """Test that provider completion is fast."""
-        from qf.completions.dynamic import complete_provider_names
-
-        start = time.time()
+        start = perf_counter()
         result = complete_provider_names(incomplete="")
-        elapsed = time.time() - start
+        elapsed = perf_counter() - start
+        record_property("elapsed_seconds", elapsed)
 
         assert isinstance(result, list)
         assert elapsed < 0.5  # Allow up to 500ms
@@ -3,27 +3,29 @@
 from pathlib import Path
 
 import yaml
-from typer.testing import CliRunner
 
 from qf.cli import app
+from tests.commands.assertions import assert_all_in
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
+# libyaml's C parser when PyYAML was built with it, pure Python otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def test_config_list_in_project(tmp_path, monkeypatch, mock_questionary_init):
-    """Test listing config in a project"""
-    monkeypatch.chdir(tmp_path)
 
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
+def read_config():
+    """Parse the project's config.yml"""
+    config_path = Path(".questfoundry") / "config.yml"
+    return yaml.load(config_path.read_bytes(), Loader=YAML_LOADER)
 
+
+def test_config_list_in_project(initialized_project):
+    """Test listing config in a project"""
     # List config
-    result = runner.invoke(app, ["config", "list"])
+    result = runner.invoke(app, ["config", "list"], catch_exceptions=False)
     assert result.exit_code == 0
-    assert "Configuration" in result.stdout
-    assert "providers" in result.stdout
-    assert "ui" in result.stdout
+    assert_all_in(result.stdout, "Configuration", "providers", "ui")
 
 
 def test_config_list_without_project(tmp_path, monkeypatch):
@@ -34,93 +36,63 @@ def test_config_list_without_project(tmp_path, monkeypatch):
     assert "No project found" in result.stdout
 
 
-def test_config_get_existing_key(tmp_path, monkeypatch, mock_questionary_init):
+def test_config_get_existing_key(initialized_project):
     """Test getting an existing config key"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Get a config value
-    result = runner.invoke(app, ["config", "get", "ui.color"])
+    result = runner.invoke(app, ["config", "get", "ui.color"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "ui.color" in result.stdout
 
 
-def test_config_get_nonexistent_key(tmp_path, monkeypatch, mock_questionary_init):
+def test_config_get_nonexistent_key(initialized_project):
     """Test getting a nonexistent config key"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Try to get nonexistent key
     result = runner.invoke(app, ["config", "get", "nonexistent.key"])
     assert result.exit_code == 1
     assert "not found" in result.stdout
 
 
-def test_config_set_new_key(tmp_path, monkeypatch, mock_questionary_init):
+def test_config_set_new_key(initialized_project):
     """Test setting a new config key"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Set a new value
     result = runner.invoke(
-        app, ["config", "set", "providers.text.openai.model", "gpt-4o"]
+        app,
+        ["config", "set", "providers.text.openai.model", "gpt-4o"],
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
     assert "Configuration updated" in result.stdout
 
     # Verify it was set
-    config_path = Path(".questfoundry") / "config.yml"
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = read_config()
     assert config["providers"]["text"]["openai"]["model"] == "gpt-4o"
 
 
-def test_config_set_boolean_value(tmp_path, monkeypatch, mock_questionary_init):
+def test_config_set_boolean_value(initialized_project):
     """Test setting a boolean config value"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Set a boolean value
     result = runner.invoke(
-        app, ["config", "set", "ui.color", "false"]
+        app, ["config", "set", "ui.color", "false"], catch_exceptions=False
     )
     assert result.exit_code == 0
 
     # Verify it was set as boolean
-    config_path = Path(".questfoundry") / "config.yml"
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = read_config()
     assert config["ui"]["color"] is False
 
 
-def test_config_masks_sensitive_values(tmp_path, monkeypatch, mock_questionary_init):
+def test_config_masks_sensitive_values(initialized_project):
     """Test that sensitive values are masked"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Set an API key
     result = runner.invoke(
-        app, ["config", "set", "providers.text.openai.api_key", "sk-1234567890abcdef"]
+        app,
+        ["config", "set", "providers.text.openai.api_key", "sk-1234567890abcdef"],
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
 
     # List config and verify masking
-    result = runner.invoke(app, ["config", "list"])
+    result = runner.invoke(app, ["config", "list"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "sk" in result.stdout  # Shows first 2 chars
     assert "********" in result.stdout  # Rest is masked
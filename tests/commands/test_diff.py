@@ -1,23 +1,49 @@
 """Tests for artifact diff command"""
 
 import json
+import re
+import shutil
 
-from typer.testing import CliRunner
+import pytest
 
 from qf.cli import app
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
+
+DIFF_MARKERS = re.compile(r"diff|added|removed|\+|-", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def workspace_skeleton(tmp_path_factory):
+    """Empty project with the hot/cold/snapshots layout, built once per session"""
+    root = tmp_path_factory.mktemp("qf_skeleton")
+    (root / ".qfproj").write_text("{}")
+    for subdir in ("hot/test-type", "cold/test-type", "snapshots"):
+        (root / ".questfoundry" / subdir).mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def diff_project(tmp_path, monkeypatch, workspace_skeleton):
+    """Copy the skeleton into `tmp_path` and chdir into it"""
+    shutil.copytree(workspace_skeleton, tmp_path, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def make_artifact(root, status, artifact):
+    """Write `artifact` into the workspace's `status` (hot/cold) tree"""
+    type_dir = root / ".questfoundry" / status / artifact["type"]
+    type_dir.mkdir(parents=True, exist_ok=True)
+    (type_dir / f"{artifact['id']}.json").write_bytes(
+        json.dumps(artifact, separators=(",", ":")).encode()
+    )
 
 
 class TestDiffCommand:
     """Tests for basic diff command functionality"""
 
-    def test_diff_help(self):
-        """Test diff help is available"""
-        result = runner.invoke(app, ["diff", "--help"])
-        assert result.exit_code == 0
-        assert "diff" in result.stdout.lower()
-
     def test_diff_no_project(self, tmp_path, monkeypatch):
         """Test diff fails without project"""
         monkeypatch.chdir(tmp_path)
@@ -25,45 +51,30 @@ class TestDiffCommand:
         assert result.exit_code != 0
         assert "no project" in result.stdout.lower()
 
-    def test_diff_artifact_not_found(self, tmp_path, monkeypatch):
+    def test_diff_artifact_not_found(self, diff_project):
         """Test diff with non-existent artifact"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         result = runner.invoke(app, ["diff", "nonexistent"])
         assert result.exit_code != 0
         assert "not found" in result.stdout.lower()
 
-    def test_diff_single_artifact(self, tmp_path, monkeypatch):
+    def test_diff_single_artifact(self, diff_project):
         """Test diff with single artifact (no versions)"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "test-type"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
         artifact_data = {
             "id": "test-artifact",
             "type": "test-type",
             "content": "Original content",
             "status": "hot",
         }
-        (hot_dir / "test-artifact.json").write_text(json.dumps(artifact_data))
+        make_artifact(diff_project, "hot", artifact_data)
 
-        result = runner.invoke(app, ["diff", "test-artifact"])
+        result = runner.invoke(app, ["diff", "test-artifact"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "test-artifact" in result.stdout
 
-    def test_diff_with_versions(self, tmp_path, monkeypatch):
+    def test_diff_with_versions(self, diff_project):
         """Test diff with multiple versions of artifact"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create hot version
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "test-type"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
         hot_artifact = {
             "id": "test-artifact",
             "type": "test-type",
@@ -71,12 +82,9 @@ class TestDiffCommand:
             "status": "hot",
             "timestamp": "2024-11-09T12:00:00Z",
         }
-        (hot_dir / "test-artifact.json").write_text(json.dumps(hot_artifact))
+        make_artifact(diff_project, "hot", hot_artifact)
 
         # Create cold version
-        cold_dir = tmp_path / ".questfoundry" / "cold" / "test-type"
-        cold_dir.mkdir(parents=True, exist_ok=True)
-
         cold_artifact = {
             "id": "test-artifact",
             "type": "test-type",
@@ -84,9 +92,9 @@ class TestDiffCommand:
             "status": "cold",
             "timestamp": "2024-11-08T12:00:00Z",
         }
-        (cold_dir / "test-artifact.json").write_text(json.dumps(cold_artifact))
+        make_artifact(diff_project, "cold", cold_artifact)
 
-        result = runner.invoke(app, ["diff", "test-artifact"])
+        result = runner.invoke(app, ["diff", "test-artifact"], catch_exceptions=False)
         assert result.exit_code == 0
         # Should show diff indicators
         assert any(indicator in result.stdout for indicator in ["+", "-", "Updated"])
@@ -95,116 +103,88 @@ class TestDiffCommand:
 class TestDiffOptions:
     """Tests for diff command options"""
 
-    def test_diff_with_snapshot_option(self, tmp_path, monkeypatch):
+    def test_diff_with_snapshot_option(self, diff_project):
         """Test diff with specific snapshot reference"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "test-type"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
         artifact_data = {
             "id": "test-artifact",
             "type": "test-type",
             "content": "Current",
         }
-        (hot_dir / "test-artifact.json").write_text(json.dumps(artifact_data))
+        make_artifact(diff_project, "hot", artifact_data)
 
-        # Create snapshots directory
-        snapshots_dir = tmp_path / ".questfoundry" / "snapshots"
-        snapshots_dir.mkdir(parents=True, exist_ok=True)
+        # Create snapshot
+        snapshots_dir = diff_project / ".questfoundry" / "snapshots"
         (snapshots_dir / "snapshot-1.json").write_text(json.dumps({"artifacts": {}}))
 
         result = runner.invoke(
-            app, ["diff", "test-artifact", "--snapshot", "snapshot-1"]
+            app,
+            ["diff", "test-artifact", "--snapshot", "snapshot-1"],
+            catch_exceptions=False,
         )
         assert result.exit_code == 0
 
-    def test_diff_between_tu_option(self, tmp_path, monkeypatch):
+    def test_diff_between_tu_option(self, diff_project):
         """Test diff between two time units"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "test-type"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
         artifact_data = {
             "id": "test-artifact",
             "type": "test-type",
             "content": "V2",
         }
-        (hot_dir / "test-artifact.json").write_text(json.dumps(artifact_data))
+        make_artifact(diff_project, "hot", artifact_data)
 
         result = runner.invoke(
             app, ["diff", "test-artifact", "--from", "tu:1", "--to", "tu:2"]
         )
         assert result.exit_code in [0, 1]  # May succeed or fail gracefully
 
+
 class TestDiffCompletion:
     """Tests for diff command completion"""
 
-    def test_diff_command_has_completion(self):
+    def test_diff_command_has_completion(self, help_text):
         """Test diff command has artifact ID completion"""
         # Check that diff command is registered
-        result = runner.invoke(app, ["diff", "--help"])
-        assert result.exit_code == 0
+        assert "ARTIFACT_ID" in help_text("diff")
         # Completion is implicit in Typer with add_completion=True
 
 
 class TestDiffOutput:
     """Tests for diff output formatting"""
 
-    def test_diff_output_has_header(self, tmp_path, monkeypatch):
+    def test_diff_output_has_header(self, diff_project):
         """Test diff output includes artifact header"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "test-type"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
         artifact_data = {
             "id": "test-artifact",
             "type": "test-type",
             "content": "Test content",
         }
-        (hot_dir / "test-artifact.json").write_text(json.dumps(artifact_data))
+        make_artifact(diff_project, "hot", artifact_data)
 
-        result = runner.invoke(app, ["diff", "test-artifact"])
+        result = runner.invoke(app, ["diff", "test-artifact"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "test-artifact" in result.stdout
 
-    def test_diff_shows_statistics(self, tmp_path, monkeypatch):
+    def test_diff_shows_statistics(self, diff_project):
         """Test diff shows change statistics"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create hot and cold versions
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "test-type"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
         hot_artifact = {
             "id": "test-artifact",
             "type": "test-type",
             "content": "A\nB\nC\nD",
         }
-        (hot_dir / "test-artifact.json").write_text(json.dumps(hot_artifact))
-
-        cold_dir = tmp_path / ".questfoundry" / "cold" / "test-type"
-        cold_dir.mkdir(parents=True, exist_ok=True)
+        make_artifact(diff_project, "hot", hot_artifact)
 
         cold_artifact = {
             "id": "test-artifact",
             "type": "test-type",
             "content": "A\nB",
         }
-        (cold_dir / "test-artifact.json").write_text(json.dumps(cold_artifact))
+        make_artifact(diff_project, "cold", cold_artifact)
 
-        result = runner.invoke(app, ["diff", "test-artifact"])
+        result = runner.invoke(app, ["diff", "test-artifact"], catch_exceptions=False)
         assert result.exit_code == 0
         # Should contain diff markers or statistics
-        output_lower = result.stdout.lower()
-        markers = ["diff", "added", "removed", "+", "-"]
-        assert any(marker in output_lower for marker in markers)
+        assert DIFF_MARKERS.search(result.stdout)
@@ -1,50 +1,62 @@
 """Tests for generate command."""
 
 import json
-import tempfile
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from typer.testing import CliRunner
 
 from qf.cli import app
 from qf.commands import generate
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
+
+
+@pytest.fixture(scope="session")
+def role_mocks():
+    """Mock graph built once per session; `mock_role_execution` rewires it"""
+    return {
+        name: MagicMock()
+        for name in ("result", "artifact", "role", "registry", "workspace")
+    }
 
 
 @pytest.fixture
-def mock_role_execution(monkeypatch):
+def mock_role_execution(monkeypatch, role_mocks):
     """Mock questfoundry-py role execution for testing."""
+    # Tests reconfigure return values, so clear them along with call history
+    for mock in role_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
     # Mock successful role execution
-    mock_result = MagicMock()
+    mock_result = role_mocks["result"]
     mock_result.success = True
     mock_result.error = None
     mock_result.output = "Generated content"
 
     # Mock artifacts
-    mock_artifact = MagicMock()
+    mock_artifact = role_mocks["artifact"]
     mock_artifact.artifact_id = "generated-001"
     mock_result.artifacts = [mock_artifact]
 
     # Mock role
-    mock_role = MagicMock()
+    mock_role = role_mocks["role"]
     mock_role.execute_task.return_value = mock_result
 
     # Mock role registry
-    mock_registry = MagicMock()
+    mock_registry = role_mocks["registry"]
     mock_registry.get_role.return_value = mock_role
 
     # Mock workspace
-    mock_workspace = MagicMock()
+    mock_workspace = role_mocks["workspace"]
     mock_workspace.path = Path("/tmp/test")
-    mock_workspace.save_hot_artifact = MagicMock()
-    mock_workspace.list_hot_artifacts = MagicMock(return_value=[])
+    mock_workspace.list_hot_artifacts.return_value = []
 
     # Patch the utility functions
-    monkeypatch.setattr("qf.commands.generate.get_workspace", lambda: mock_workspace)
-    monkeypatch.setattr("qf.commands.generate.get_role_registry", lambda: mock_registry)
+    monkeypatch.setattr(generate, "get_workspace", lambda: mock_workspace)
+    monkeypatch.setattr(generate, "get_role_registry", lambda: mock_registry)
 
     return {
         "result": mock_result,
@@ -55,120 +67,96 @@ def mock_role_execution(monkeypatch):
 
 
 @pytest.fixture
-def temp_project():
-    """Create a temporary project with workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Create project file
-        project_file = tmpdir_path / "test.qfproj"
-        project_file.write_text("name: Test Project\n")
-
-        # Create workspace
-        workspace = tmpdir_path / ".questfoundry"
-        workspace.mkdir()
-        hot = workspace / "hot"
-        hot.mkdir()
-
-        # Create artifact directories
-        shotlists_dir = hot / "shotlists"
-        shotlists_dir.mkdir()
-        audio_dir = hot / "audio"
-        audio_dir.mkdir()
-        tus_dir = hot / "tus"
-        tus_dir.mkdir()
-        hooks_dir = hot / "hooks"
-        hooks_dir.mkdir()
-
-        # Save current directory and change to temp
-        import os
-        old_cwd = os.getcwd()
-        os.chdir(tmpdir_path)
-
-        yield tmpdir_path
-
-        # Restore directory
-        os.chdir(old_cwd)
-
-
-@pytest.fixture
-def shotlist_artifact(temp_project):
-    """Create a test shotlist artifact."""
-    artifact = {
-        "id": "SHOT-001",
-        "type": "shotlist",
-        "title": "Lighthouse Scene",
-        "status": "draft",
-        "description": "Visual shots for lighthouse scene",
-        "shots": [
-            {"id": "S1", "description": "Wide shot of lighthouse at dusk"},
-            {"id": "S2", "description": "Close-up of keeper's face"},
-        ]
-    }
-
-    artifact_file = (
-        temp_project / ".questfoundry" / "hot" / "shotlists" / "SHOT-001.json"
-    )
-    artifact_file.write_text(json.dumps(artifact))
-
-    return artifact
-
-
-@pytest.fixture
-def cuelist_artifact(temp_project):
-    """Create a test cuelist artifact."""
-    artifact = {
-        "id": "CUE-001",
-        "type": "cuelist",
-        "title": "Lighthouse Audio Cues",
-        "status": "draft",
-        "description": "Audio cues for lighthouse scene",
-        "cues": [
-            {"id": "C1", "description": "Foghorn in distance"},
-            {"id": "C2", "description": "Wind howling"},
-        ]
-    }
-
-    artifact_file = temp_project / ".questfoundry" / "hot" / "audio" / "CUE-001.json"
-    artifact_file.write_text(json.dumps(artifact))
-
-    return artifact
+def empty_cwd(tmp_path, monkeypatch):
+    """Chdir into an empty directory that has no project."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 @pytest.fixture
-def tu_artifact(temp_project):
-    """Create a test TU artifact."""
-    artifact = {
-        "id": "TU-001",
-        "type": "tu",
-        "title": "The Lighthouse Keeper",
-        "status": "draft",
-        "description": "Main turning unit for lighthouse story",
-        "loop": "story-spark",
-    }
-
-    artifact_file = temp_project / ".questfoundry" / "hot" / "tus" / "TU-001.json"
-    artifact_file.write_text(json.dumps(artifact))
-
-    return artifact
+def temp_project(tmp_path, monkeypatch):
+    """Create a temporary project with workspace."""
+    # Create project file
+    project_file = tmp_path / "test.qfproj"
+    project_file.write_text("name: Test Project\n")
+
+    # Create workspace with artifact directories
+    hot = tmp_path / ".questfoundry" / "hot"
+    for artifact_dir in ("shotlists", "audio", "tus", "hooks"):
+        (hot / artifact_dir).mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def encode_hot_artifact(subdir, artifact):
+    """Pair an artifact's path under `.questfoundry/hot` with its JSON bytes"""
+    path = Path(".questfoundry", "hot", subdir, f"{artifact['id']}.json")
+    return path, json.dumps(artifact).encode()
+
+
+SHOTLIST = {
+    "id": "SHOT-001",
+    "type": "shotlist",
+    "title": "Lighthouse Scene",
+    "status": "draft",
+    "description": "Visual shots for lighthouse scene",
+    "shots": [
+        {"id": "S1", "description": "Wide shot of lighthouse at dusk"},
+        {"id": "S2", "description": "Close-up of keeper's face"},
+    ],
+}
+
+CUELIST = {
+    "id": "CUE-001",
+    "type": "cuelist",
+    "title": "Lighthouse Audio Cues",
+    "status": "draft",
+    "description": "Audio cues for lighthouse scene",
+    "cues": [
+        {"id": "C1", "description": "Foghorn in distance"},
+        {"id": "C2", "description": "Wind howling"},
+    ],
+}
+
+TU = {
+    "id": "TU-001",
+    "type": "tu",
+    "title": "The Lighthouse Keeper",
+    "status": "draft",
+    "description": "Main turning unit for lighthouse story",
+    "loop": "story-spark",
+}
+
+HOOK = {
+    "id": "HOOK-001",
+    "type": "hook",
+    "title": "The Lighthouse Keeper's Secret",
+    "status": "proposed",
+    "description": "A hook about the lighthouse keeper's hidden past",
+    "stakes": 4,
+}
+
+
+# Artifact directory under `.questfoundry/hot` -> artifact written there
+HOT_ARTIFACTS = {"shotlists": SHOTLIST, "audio": CUELIST, "tus": TU, "hooks": HOOK}
+ENCODED_ARTIFACTS = [
+    encode_hot_artifact(subdir, artifact) for subdir, artifact in HOT_ARTIFACTS.items()
+]
 
 
 @pytest.fixture
-def hook_artifact(temp_project):
-    """Create a test hook artifact."""
-    artifact = {
-        "id": "HOOK-001",
-        "type": "hook",
-        "title": "The Lighthouse Keeper's Secret",
-        "status": "proposed",
-        "description": "A hook about the lighthouse keeper's hidden past",
-        "stakes": 4,
-    }
-
-    artifact_file = temp_project / ".questfoundry" / "hot" / "hooks" / "HOOK-001.json"
-    artifact_file.write_text(json.dumps(artifact))
-
-    return artifact
+def artifacts(temp_project):
+    """Write every test artifact into the workspace, keyed by artifact type."""
+    # Plain fd writes: the payloads are tiny and already encoded, so no
+    # buffered file object is needed
+    for path, data in ENCODED_ARTIFACTS:
+        fd = os.open(temp_project / path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+    return {artifact["type"]: artifact for artifact in HOT_ARTIFACTS.values()}
 
 
 def test_generate_command_group_exists():
@@ -181,19 +169,11 @@ def test_generate_command_group_exists():
     assert hasattr(generate, "generate_images")
 
 
-def test_generate_image_no_project():
+def test_generate_image_no_project(empty_cwd):
     """Test generate image without a project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        import os
-        old_cwd = os.getcwd()
-        os.chdir(tmpdir)
-
-        try:
-            result = runner.invoke(app, ["generate", "image", "SHOT-001"])
-            assert result.exit_code == 1
-            assert "No project found" in result.stdout
-        finally:
-            os.chdir(old_cwd)
+    result = runner.invoke(app, ["generate", "image", "SHOT-001"])
+    assert result.exit_code == 1
+    assert "No project found" in result.stdout
 
 
 def test_generate_image_artifact_not_found(temp_project):
@@ -203,69 +183,52 @@ def test_generate_image_artifact_not_found(temp_project):
     assert "Artifact not found" in result.stdout
 
 
-def test_generate_image_wrong_artifact_type(temp_project, tu_artifact):
+def test_generate_image_wrong_artifact_type(temp_project, artifacts):
     """Test generate image with wrong artifact type."""
     result = runner.invoke(app, ["generate", "image", "TU-001"])
     assert result.exit_code == 1
     assert "Expected artifact type" in result.stdout
 
 
-def test_generate_image_success(temp_project, shotlist_artifact, mock_role_execution):
+def test_generate_image_success(temp_project, artifacts, mock_role_execution):
     """Test successful image generation."""
-    result = runner.invoke(app, ["generate", "image", "SHOT-001"])
-    assert result.exit_code == 0
-    assert "Generated successfully" in result.stdout
-    assert "SHOT-001" in result.stdout
-
-
-def test_generate_image_with_provider(
-    temp_project, shotlist_artifact, mock_role_execution
-):
-    """Test image generation with provider override."""
-    result = runner.invoke(
-        app, ["generate", "image", "SHOT-001", "--provider", "dalle"]
-    )
-    assert result.exit_code == 0
-    assert "Provider: dalle" in result.stdout
-
-
-def test_generate_image_with_model(
-    temp_project, shotlist_artifact, mock_role_execution
-):
-    """Test image generation with model override."""
     result = runner.invoke(
-        app, ["generate", "image", "SHOT-001", "--model", "dall-e-3"]
+        app, ["generate", "image", "SHOT-001"], catch_exceptions=False
     )
     assert result.exit_code == 0
-    assert "Model: dall-e-3" in result.stdout
+    assert "Generated successfully" in result.stdout
+    assert "SHOT-001" in result.stdout
 
 
-def test_generate_image_with_provider_and_model(
-    temp_project, shotlist_artifact, mock_role_execution
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        (["--provider", "dalle"], ["Provider: dalle"]),
+        (["--model", "dall-e-3"], ["Model: dall-e-3"]),
+        (
+            ["--provider", "dalle", "--model", "dall-e-3"],
+            ["Provider: dalle", "Model: dall-e-3"],
+        ),
+    ],
+    ids=["provider", "model", "provider-and-model"],
+)
+def test_generate_image_with_overrides(
+    temp_project, artifacts, mock_role_execution, options, expected
 ):
-    """Test image generation with both provider and model."""
+    """Test image generation with provider and/or model overrides."""
     result = runner.invoke(
-        app,
-        ["generate", "image", "SHOT-001", "--provider", "dalle", "--model", "dall-e-3"],
+        app, ["generate", "image", "SHOT-001", *options], catch_exceptions=False
     )
     assert result.exit_code == 0
-    assert "Provider: dalle" in result.stdout
-    assert "Model: dall-e-3" in result.stdout
+    for line in expected:
+        assert line in result.stdout
 
 
-def test_generate_audio_no_project():
+def test_generate_audio_no_project(empty_cwd):
     """Test generate audio without a project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        import os
-        old_cwd = os.getcwd()
-        os.chdir(tmpdir)
-
-        try:
-            result = runner.invoke(app, ["generate", "audio", "CUE-001"])
-            assert result.exit_code == 1
-            assert "No project found" in result.stdout
-        finally:
-            os.chdir(old_cwd)
+    result = runner.invoke(app, ["generate", "audio", "CUE-001"])
+    assert result.exit_code == 1
+    assert "No project found" in result.stdout
 
 
 def test_generate_audio_artifact_not_found(temp_project):
@@ -275,44 +238,38 @@ def test_generate_audio_artifact_not_found(temp_project):
     assert "Artifact not found" in result.stdout
 
 
-def test_generate_audio_wrong_artifact_type(temp_project, shotlist_artifact):
+def test_generate_audio_wrong_artifact_type(temp_project, artifacts):
     """Test generate audio with wrong artifact type."""
     result = runner.invoke(app, ["generate", "audio", "SHOT-001"])
     assert result.exit_code == 1
     assert "Expected artifact type" in result.stdout
 
 
-def test_generate_audio_success(temp_project, cuelist_artifact, mock_role_execution):
+def test_generate_audio_success(temp_project, artifacts, mock_role_execution):
     """Test successful audio generation."""
-    result = runner.invoke(app, ["generate", "audio", "CUE-001"])
+    result = runner.invoke(
+        app, ["generate", "audio", "CUE-001"], catch_exceptions=False
+    )
     assert result.exit_code == 0
     assert "Generated successfully" in result.stdout
 
 
-def test_generate_audio_with_provider(
-    temp_project, cuelist_artifact, mock_role_execution
-):
+def test_generate_audio_with_provider(temp_project, artifacts, mock_role_execution):
     """Test audio generation with provider override."""
     result = runner.invoke(
-        app, ["generate", "audio", "CUE-001", "--provider", "elevenlabs"]
+        app,
+        ["generate", "audio", "CUE-001", "--provider", "elevenlabs"],
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
     assert "Provider: elevenlabs" in result.stdout
 
 
-def test_generate_scene_no_project():
+def test_generate_scene_no_project(empty_cwd):
     """Test generate scene without a project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        import os
-        old_cwd = os.getcwd()
-        os.chdir(tmpdir)
-
-        try:
-            result = runner.invoke(app, ["generate", "scene", "TU-001"])
-            assert result.exit_code == 1
-            assert "No project found" in result.stdout
-        finally:
-            os.chdir(old_cwd)
+    result = runner.invoke(app, ["generate", "scene", "TU-001"])
+    assert result.exit_code == 1
+    assert "No project found" in result.stdout
 
 
 def test_generate_scene_artifact_not_found(temp_project):
@@ -322,42 +279,36 @@ def test_generate_scene_artifact_not_found(temp_project):
     assert "Artifact not found" in result.stdout
 
 
-def test_generate_scene_wrong_artifact_type(temp_project, hook_artifact):
+def test_generate_scene_wrong_artifact_type(temp_project, artifacts):
     """Test generate scene with wrong artifact type."""
     result = runner.invoke(app, ["generate", "scene", "HOOK-001"])
     assert result.exit_code == 1
     assert "Expected artifact type" in result.stdout
 
 
-def test_generate_scene_success(temp_project, tu_artifact, mock_role_execution):
+def test_generate_scene_success(temp_project, artifacts, mock_role_execution):
     """Test successful scene generation."""
-    result = runner.invoke(app, ["generate", "scene", "TU-001"])
+    result = runner.invoke(app, ["generate", "scene", "TU-001"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "Generated successfully" in result.stdout
 
 
-def test_generate_scene_with_provider(temp_project, tu_artifact, mock_role_execution):
+def test_generate_scene_with_provider(temp_project, artifacts, mock_role_execution):
     """Test scene generation with provider override."""
     result = runner.invoke(
-        app, ["generate", "scene", "TU-001", "--provider", "openai"]
+        app,
+        ["generate", "scene", "TU-001", "--provider", "openai"],
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
     assert "Provider: openai" in result.stdout
 
 
-def test_generate_canon_no_project():
+def test_generate_canon_no_project(empty_cwd):
     """Test generate canon without a project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        import os
-        old_cwd = os.getcwd()
-        os.chdir(tmpdir)
-
-        try:
-            result = runner.invoke(app, ["generate", "canon", "HOOK-001"])
-            assert result.exit_code == 1
-            assert "No project found" in result.stdout
-        finally:
-            os.chdir(old_cwd)
+    result = runner.invoke(app, ["generate", "canon", "HOOK-001"])
+    assert result.exit_code == 1
+    assert "No project found" in result.stdout
 
 
 def test_generate_canon_artifact_not_found(temp_project):
@@ -367,42 +318,38 @@ def test_generate_canon_artifact_not_found(temp_project):
     assert "Artifact not found" in result.stdout
 
 
-def test_generate_canon_wrong_artifact_type(temp_project, tu_artifact):
+def test_generate_canon_wrong_artifact_type(temp_project, artifacts):
     """Test generate canon with wrong artifact type."""
     result = runner.invoke(app, ["generate", "canon", "TU-001"])
     assert result.exit_code == 1
     assert "Expected artifact type" in result.stdout
 
 
-def test_generate_canon_success(temp_project, hook_artifact, mock_role_execution):
+def test_generate_canon_success(temp_project, artifacts, mock_role_execution):
     """Test successful canonization."""
-    result = runner.invoke(app, ["generate", "canon", "HOOK-001"])
+    result = runner.invoke(
+        app, ["generate", "canon", "HOOK-001"], catch_exceptions=False
+    )
     assert result.exit_code == 0
     assert "Generated successfully" in result.stdout
 
 
-def test_generate_canon_with_provider(temp_project, hook_artifact, mock_role_execution):
+def test_generate_canon_with_provider(temp_project, artifacts, mock_role_execution):
     """Test canonization with provider override."""
     result = runner.invoke(
-        app, ["generate", "canon", "HOOK-001", "--provider", "openai"]
+        app,
+        ["generate", "canon", "HOOK-001", "--provider", "openai"],
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
     assert "Provider: openai" in result.stdout
 
 
-def test_generate_images_batch_no_project():
+def test_generate_images_batch_no_project(empty_cwd):
     """Test batch image generation without a project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        import os
-        old_cwd = os.getcwd()
-        os.chdir(tmpdir)
-
-        try:
-            result = runner.invoke(app, ["generate", "images", "--pending"])
-            assert result.exit_code == 1
-            assert "No project found" in result.stdout
-        finally:
-            os.chdir(old_cwd)
+    result = runner.invoke(app, ["generate", "images", "--pending"])
+    assert result.exit_code == 1
+    assert "No project found" in result.stdout
 
 
 def test_generate_images_batch_no_pending_flag(temp_project):
@@ -427,33 +374,29 @@ def test_generate_images_batch_success(temp_project, mock_role_execution):
 
     mock_workspace.list_hot_artifacts.return_value = mock_shotlists
 
-    result = runner.invoke(app, ["generate", "images", "--pending"])
-    assert result.exit_code == 0
-    assert "Batch generation complete" in result.stdout
-    assert "Generated: 3 image(s)" in result.stdout
-
-
-def test_generate_images_batch_with_provider(temp_project, mock_role_execution):
-    """Test batch image generation with provider override."""
-    # Mock workspace to return pending shotlists as Artifact-like objects
-    mock_workspace = mock_role_execution["workspace"]
-
-    mock_shotlist = MagicMock()
-    mock_shotlist.artifact_id = "SHOT-001"
-    mock_shotlist.type = "shotlist"
-    mock_workspace.list_hot_artifacts.return_value = [mock_shotlist]
-
     result = runner.invoke(
-        app, ["generate", "images", "--pending", "--provider", "midjourney"]
+        app, ["generate", "images", "--pending"], catch_exceptions=False
     )
     assert result.exit_code == 0
-    assert "Provider: midjourney" in result.stdout
+    assert "Batch generation complete" in result.stdout
+    assert "Generated: 3 image(s)" in result.stdout
 
 
-def test_generate_images_batch_with_provider_and_model(
-    temp_project, mock_role_execution
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        (["--provider", "midjourney"], ["Provider: midjourney"]),
+        (
+            ["--provider", "dalle", "--model", "dall-e-3"],
+            ["Provider: dalle", "Model: dall-e-3"],
+        ),
+    ],
+    ids=["provider", "provider-and-model"],
+)
+def test_generate_images_batch_with_overrides(
+    temp_project, mock_role_execution, options, expected
 ):
-    """Test batch image generation with both provider and model."""
+    """Test batch image generation with provider and/or model overrides."""
     # Mock workspace to return pending shotlists as Artifact-like objects
     mock_workspace = mock_role_execution["workspace"]
 
@@ -463,23 +406,14 @@ def test_generate_images_batch_with_provider_and_model(
     mock_workspace.list_hot_artifacts.return_value = [mock_shotlist]
 
     result = runner.invoke(
-        app,
-        [
-            "generate",
-            "images",
-            "--pending",
-            "--provider",
-            "dalle",
-            "--model",
-            "dall-e-3",
-        ],
+        app, ["generate", "images", "--pending", *options], catch_exceptions=False
     )
     assert result.exit_code == 0
-    assert "Provider: dalle" in result.stdout
-    assert "Model: dall-e-3" in result.stdout
+    for line in expected:
+        assert line in result.stdout
 
 
-def test_find_artifact_in_hot_directory(temp_project, shotlist_artifact):
+def test_find_artifact_in_hot_directory(temp_project, artifacts):
     """Test finding an artifact in the hot directory."""
     artifact = generate.find_artifact("SHOT-001")
     assert artifact is not None
@@ -504,7 +438,7 @@ def test_find_artifact_by_id_in_content(temp_project):
     assert artifact is not None
 
 
-def test_load_artifact(temp_project, shotlist_artifact):
+def test_load_artifact(temp_project, artifacts):
     """Test loading an artifact."""
     artifact = generate.load_artifact("SHOT-001")
     assert artifact is not None
@@ -518,14 +452,14 @@ def test_load_artifact_not_found(temp_project):
     assert artifact is None
 
 
-def test_validate_artifact_type_valid(temp_project, shotlist_artifact):
+def test_validate_artifact_type_valid(temp_project, artifacts):
     """Test artifact type validation with valid type."""
     is_valid, artifact = generate.validate_artifact_type("SHOT-001", ["shotlist"])
     assert is_valid is True
     assert artifact is not None
 
 
-def test_validate_artifact_type_invalid_type(temp_project, shotlist_artifact):
+def test_validate_artifact_type_invalid_type(temp_project, artifacts):
     """Test artifact type validation with invalid type."""
     is_valid, artifact = generate.validate_artifact_type("SHOT-001", ["tu"])
     assert is_valid is False
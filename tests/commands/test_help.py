@@ -0,0 +1,21 @@
+"""Tests for per-command help text"""
+
+import pytest
+
+from tests.commands.assertions import assert_all_in
+
+# Each command's help line, followed by the arguments and options it documents
+COMMAND_HELP = {
+    "run": ["Execute a loop", "LOOP_NAME", "--interactive"],
+    "search": ["Search artifacts", "QUERY", "--type", "--field", "--limit"],
+    "shell": ["Start interactive shell", "--verbose", "--no-history"],
+    "show": ["Show artifact details", "ARTIFACT_ID"],
+    "status": ["Show project status"],
+    "diff": ["Compare artifact versions", "ARTIFACT_ID", "--snapshot", "--from"],
+}
+
+
+@pytest.mark.parametrize("command,needles", COMMAND_HELP.items(), ids=COMMAND_HELP)
+def test_command_help(help_text, command, needles):
+    """Test each command's help shows its summary, arguments and options"""
+    assert_all_in(help_text(command), *needles)
@@ -1,11 +1,10 @@
 """Tests for qf history command"""
 
 
-from typer.testing import CliRunner
-
 from qf.cli import app
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 def test_history_shows_empty_state(tmp_path, monkeypatch):
@@ -2,11 +2,10 @@
 
 import json
 
-from typer.testing import CliRunner
-
 from qf.cli import app
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 def test_init_creates_project(tmp_path, monkeypatch):
@@ -14,24 +13,6 @@ def test_init_creates_project(tmp_path, monkeypatch):
     # Change to temp directory
     monkeypatch.chdir(tmp_path)
 
-    # Mock questionary.text to auto-respond
-    import questionary
-
-    original_text = questionary.text
-
-    def mock_text(message, **kwargs):
-        if "name" in message.lower():
-            result = original_text(message, **kwargs)
-            result.ask = lambda: "test-project"
-            return result
-        elif "description" in message.lower():
-            result = original_text(message, **kwargs)
-            result.ask = lambda: "Test description"
-            return result
-        return original_text(message, **kwargs)
-
-    monkeypatch.setattr(questionary, "text", mock_text)
-
     # Run init command
     result = runner.invoke(app, ["init"])
 
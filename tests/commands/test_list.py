@@ -1,11 +1,10 @@
 """Tests for qf list command"""
 
 
-from typer.testing import CliRunner
-
 from qf.cli import app
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 def test_list_shows_no_artifacts(tmp_path, monkeypatch):
@@ -19,7 +18,7 @@ def test_list_shows_no_artifacts(tmp_path, monkeypatch):
     workspace.mkdir()
 
     # Run list command
-    result = runner.invoke(app, ["list"])
+    result = runner.invoke(app, ["list"], catch_exceptions=False)
 
     # Should succeed even with no artifacts
     assert result.exit_code == 0
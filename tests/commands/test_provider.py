@@ -1,27 +1,22 @@
 """Tests for provider commands"""
 
-from typer.testing import CliRunner
+import re
 
 from qf.cli import app
+from tests.commands.assertions import assert_all_in
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
+DEFAULT_OPENAI_ROW = re.compile(r"OpenAI[^\n]*text[^\n]*✓")
 
-def test_provider_list_in_project(tmp_path, monkeypatch, mock_questionary_init):
-    """Test listing providers in a project"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
 
+def test_provider_list_in_project(initialized_project):
+    """Test listing providers in a project"""
     # List providers
     result = runner.invoke(app, ["provider", "list"])
     assert result.exit_code == 0
-    assert "Available Providers" in result.stdout
-    assert "OpenAI" in result.stdout
-    assert "Anthropic" in result.stdout
-    assert "text" in result.stdout
+    assert_all_in(result.stdout, "Available Providers", "OpenAI", "Anthropic", "text")
 
 
 def test_provider_list_without_project(tmp_path, monkeypatch):
@@ -32,36 +27,19 @@ def test_provider_list_without_project(tmp_path, monkeypatch):
     assert "No project found" in result.stdout
 
 
-def test_provider_list_shows_default(tmp_path, monkeypatch, mock_questionary_init):
+def test_provider_list_shows_default(initialized_project):
     """Test that provider list shows the default provider"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # List providers
     result = runner.invoke(app, ["provider", "list"])
     assert result.exit_code == 0
 
-    # Check that openai is marked as default (from template config)
-    lines = result.stdout.split("\n")
-    # Find the OpenAI row and check for checkmark in Default column
-    for line in lines:
-        if "OpenAI" in line and "text" in line:
-            assert "✓" in line
+    # Check that openai is marked as default (from template config): the
+    # OpenAI text row carries a checkmark in the Default column
+    assert DEFAULT_OPENAI_ROW.search(result.stdout)
 
 
-def test_provider_list_shows_configured_status(
-    tmp_path, monkeypatch, mock_questionary_init
-):
+def test_provider_list_shows_configured_status(initialized_project):
     """Test that provider list shows configured status"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Configure OpenAI provider
     result = runner.invoke(
         app, ["config", "set", "providers.text.openai.api_key", "sk-test"]
@@ -1,31 +1,62 @@
 """Tests for quickstart workflow command."""
 
 import json
-import re
-import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
+import pytest
 
 from qf.cli import app
 from qf.interactive import QuickstartSession
+from tests.runner import CachedCliRunner
 
-# Configure runner for testing with proper environment
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
-def strip_ansi_codes(text: str) -> str:
-    """Remove ANSI escape codes from text.
+@pytest.fixture(scope="module")
+def quickstart_help(help_text):
+    """Lowercased `qf quickstart --help` output, rendered once per module"""
+    return help_text("quickstart").lower()
 
-    Args:
-        text: Text potentially containing ANSI codes
 
-    Returns:
-        Text with ANSI codes removed
+@pytest.fixture
+def checkpoint_session(tmp_path, monkeypatch):
+    """Session with just the workspace directory that checkpoints are saved in.
+
+    Skips `create_project`'s subdirectories and metadata file, which
+    `test_create_project_success` covers on its own.
     """
-    ansi_pattern = re.compile(r"\x1b\[[0-9;]*m")
-    return ansi_pattern.sub("", text)
+    monkeypatch.chdir(tmp_path)
+    workspace_dir = Path(".questfoundry")
+    workspace_dir.mkdir()
+
+    session = QuickstartSession()
+    session.project_name = "test-project"
+    session.premise = "A test premise"
+    session.workspace_dir = workspace_dir
+    return session
+
+
+@pytest.fixture
+def quickstart_prompts():
+    """Answer every quickstart prompt and report an interactive terminal.
+
+    Yields the prompt mocks by name so a test can change an answer.
+    """
+    prompts = {
+        "ask_premise": MagicMock(return_value="A mysterious tale with twists"),
+        "ask_tone": MagicMock(return_value="Mystery"),
+        "ask_length": MagicMock(return_value="Novella (20-50 pages)"),
+        "ask_project_name": MagicMock(return_value="mystery-tale"),
+        "confirm_setup": MagicMock(return_value=True),
+        "ask_review_artifacts": MagicMock(return_value=False),
+        "ask_continue_loop": MagicMock(return_value=True),
+    }
+    with (
+        patch("qf.interactive.prompts._is_interactive", return_value=True),
+        patch.multiple("qf.commands.quickstart", **prompts),
+    ):
+        yield prompts
 
 
 class TestQuickstartSession:
@@ -42,43 +73,40 @@ class TestQuickstartSession:
         assert session.current_loop is None
         assert session.interactive_mode is False
 
-    def test_create_project_success(self) -> None:
+    def test_create_project_success(self, tmp_path, monkeypatch) -> None:
         """Test successful project creation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                session = QuickstartSession()
-                success = session.create_project(
-                    "test-project",
-                    "A test story premise",
-                    "Mystery",
-                    "Novella",
-                )
-
-                assert success is True
-                assert session.project_name == "test-project"
-                assert session.workspace_dir is not None
-                assert session.workspace_dir.exists()
-
-                # Check workspace subdirectories exist
-                assert (session.workspace_dir / "hot").exists()
-                assert (session.workspace_dir / "cold").exists()
-                assert (session.workspace_dir / "assets").exists()
-
-                # Check metadata file created
-                metadata_file = session.workspace_dir / "project.json"
-                assert metadata_file.exists()
-
-                metadata = json.loads(metadata_file.read_text())
-                assert metadata["name"] == "test-project"
-                assert metadata["premise"] == "A test story premise"
-
-            finally:
-                os.chdir(old_cwd)
+        monkeypatch.chdir(tmp_path)
+
+        session = QuickstartSession()
+        success = session.create_project(
+            "test-project",
+            "A test story premise",
+            "Mystery",
+            "Novella",
+        )
+
+        assert success is True
+        assert session.project_name == "test-project"
+        assert session.workspace_dir is not None
+        assert session.workspace_dir.exists()
+
+        # Check workspace subdirectories exist
+        assert (session.workspace_dir / "hot").exists()
+        assert (session.workspace_dir / "cold").exists()
+        assert (session.workspace_dir / "assets").exists()
+
+        # Check metadata file created
+        metadata_file = session.workspace_dir / "project.json"
+        assert metadata_file.exists()
+
+        # Subset match: the metadata also carries a creation timestamp
+        expected = {
+            "name": "test-project",
+            "premise": "A test story premise",
+            "tone": "Mystery",
+            "length": "Novella",
+        }
+        assert expected.items() <= json.loads(metadata_file.read_text()).items()
 
     def test_start_loop(self) -> None:
         """Test marking loop as started."""
@@ -104,94 +132,49 @@ class TestQuickstartSession:
 
         assert session.completed_loops.count("hook-harvest") == 1
 
-    def test_save_checkpoint(self) -> None:
+    def test_save_checkpoint(self, checkpoint_session) -> None:
         """Test saving checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                session = QuickstartSession()
-                session.create_project(
-                    "test-project",
-                    "A test premise",
-                    "Horror",
-                    "Novel",
-                )
-                session.complete_loop("hook-harvest")
-                session.save_checkpoint()
-
-                checkpoint_file = Path(".questfoundry") / ".quickstart_checkpoint.json"
-                assert checkpoint_file.exists()
-
-                checkpoint = json.loads(checkpoint_file.read_text())
-                assert checkpoint["project_name"] == "test-project"
-                assert "hook-harvest" in checkpoint["completed_loops"]
-
-            finally:
-                os.chdir(old_cwd)
-
-    def test_load_checkpoint(self) -> None:
-        """Test loading checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                # Create and save checkpoint
-                session1 = QuickstartSession()
-                session1.create_project(
-                    "test-project",
-                    "A test premise",
-                    "Adventure",
-                    "Short",
-                )
-                session1.complete_loop("hook-harvest")
-                session1.enable_interactive_mode()
-                session1.save_checkpoint()
-
-                # Load checkpoint in new session
-                session2 = QuickstartSession()
-                success = session2.load_checkpoint()
-
-                assert success is True
-                assert session2.project_name == "test-project"
-                assert "hook-harvest" in session2.completed_loops
-                assert session2.interactive_mode is True
-
-            finally:
-                os.chdir(old_cwd)
-
-    def test_can_resume(self) -> None:
-        """Test checking if session can resume."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
+        session = checkpoint_session
+        session.complete_loop("hook-harvest")
+        session.save_checkpoint()
 
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
+        checkpoint_file = Path(".questfoundry") / ".quickstart_checkpoint.json"
+        assert checkpoint_file.exists()
 
-            try:
-                # Initially cannot resume
-                session = QuickstartSession()
-                assert session.can_resume() is False
+        # Subset match: the checkpoint also carries a save timestamp
+        expected = {
+            "project_name": "test-project",
+            "completed_loops": ["hook-harvest"],
+        }
+        assert expected.items() <= json.loads(checkpoint_file.read_text()).items()
 
-                # After creating project and checkpoint, can resume
-                session.create_project(
-                    "test-project",
-                    "A test premise",
-                    "Mystery",
-                    "Novella",
-                )
-                session.save_checkpoint()
+    def test_load_checkpoint(self, checkpoint_session) -> None:
+        """Test loading checkpoint."""
+        # Create and save checkpoint
+        session1 = checkpoint_session
+        session1.complete_loop("hook-harvest")
+        session1.enable_interactive_mode()
+        session1.save_checkpoint()
+
+        # Load checkpoint in new session
+        session2 = QuickstartSession()
+        success = session2.load_checkpoint()
+
+        assert success is True
+        assert session2.project_name == "test-project"
+        assert "hook-harvest" in session2.completed_loops
+        assert session2.interactive_mode is True
+
+    def test_can_resume(self, checkpoint_session) -> None:
+        """Test checking if session can resume."""
+        # Initially cannot resume
+        session = checkpoint_session
+        assert session.can_resume() is False
 
-                assert session.can_resume() is True
+        # After saving a checkpoint, can resume
+        session.save_checkpoint()
 
-            finally:
-                os.chdir(old_cwd)
+        assert session.can_resume() is True
 
     def test_get_session_status(self) -> None:
         """Test getting session status."""
@@ -234,90 +217,41 @@ class TestQuickstartSession:
 class TestQuickstartCommand:
     """Tests for quickstart command."""
 
-    def test_quickstart_without_project(self) -> None:
-        """Test quickstart in directory with no existing project."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                result = runner.invoke(
-                    app, ["quickstart", "--help"], env={"COLUMNS": "200"}
-                )
-                clean_output = strip_ansi_codes(result.stdout).lower()
-                assert result.exit_code == 0
-                assert "guided" in clean_output
-                assert "interactive" in clean_output
-
-            finally:
-                os.chdir(old_cwd)
-
-    def test_quickstart_help(self) -> None:
-        """Test quickstart help text."""
-        result = runner.invoke(
-            app, ["quickstart", "--help"], env={"COLUMNS": "200"}
-        )
-
-        clean_output = strip_ansi_codes(result.stdout).lower()
-        assert result.exit_code == 0
-        assert "quickstart" in clean_output
-        assert "guided" in clean_output
-        assert "interactive" in clean_output
-        assert "resume" in clean_output
-
-    def test_quickstart_guided_flag(self) -> None:
-        """Test that --guided flag is recognized."""
-        result = runner.invoke(
-            app, ["quickstart", "--help"], env={"COLUMNS": "200"}
-        )
-        clean_output = strip_ansi_codes(result.stdout)
-        assert "--guided" in clean_output
-
-    def test_quickstart_interactive_flag(self) -> None:
-        """Test that --interactive flag is recognized."""
-        result = runner.invoke(
-            app, ["quickstart", "--help"], env={"COLUMNS": "200"}
-        )
-        clean_output = strip_ansi_codes(result.stdout)
-        assert "--interactive" in clean_output or "-i" in clean_output
-
-    def test_quickstart_resume_flag(self) -> None:
-        """Test that --resume flag is recognized."""
-        result = runner.invoke(
-            app, ["quickstart", "--help"], env={"COLUMNS": "200"}
-        )
-        clean_output = strip_ansi_codes(result.stdout)
-        assert "--resume" in clean_output
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "quickstart",
+            "guided",
+            "interactive",
+            "resume",
+            "--guided",
+            "--interactive",
+            "--resume",
+        ],
+    )
+    def test_quickstart_help(self, quickstart_help, needle) -> None:
+        """Test quickstart help text lists each mode and flag."""
+        assert needle in quickstart_help
 
 
 class TestQuickstartIntegration:
     """Integration tests for quickstart workflow."""
 
-    def test_project_creation_workflow(self) -> None:
+    def test_project_creation_workflow(self, tmp_path, monkeypatch) -> None:
         """Test basic project creation workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
+        monkeypatch.chdir(tmp_path)
 
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                session = QuickstartSession()
-                success = session.create_project(
-                    "integration-test",
-                    "An integration test premise",
-                    "Fantasy",
-                    "Novel",
-                )
-
-                assert success is True
-                assert session.workspace_dir is not None
-                assert (session.workspace_dir / "project.json").exists()
+        session = QuickstartSession()
+        success = session.create_project(
+            "integration-test",
+            "An integration test premise",
+            "Fantasy",
+            "Novel",
+        )
 
-            finally:
-                os.chdir(old_cwd)
+        assert success is True
+        assert session.workspace_dir is not None
+        assert (session.workspace_dir / "project.json").exists()
 
     def test_loop_execution_sequence(self) -> None:
         """Test loop execution sequence."""
@@ -332,39 +266,24 @@ class TestQuickstartIntegration:
         assert session.completed_loops == loops
         assert session.current_loop is None
 
-    def test_checkpoint_resume_workflow(self) -> None:
+    def test_checkpoint_resume_workflow(self, checkpoint_session) -> None:
         """Test checkpoint save and resume workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                # Initial session - create project and execute loops
-                session1 = QuickstartSession()
-                session1.create_project(
-                    "checkpoint-test",
-                    "Test premise",
-                    "Mystery",
-                    "Novella",
-                )
-                session1.complete_loop("Hook Harvest")
-                session1.complete_loop("Lore Deepening")
-                session1.save_checkpoint()
-
-                # Resume session - load checkpoint and continue
-                session2 = QuickstartSession()
-                assert session2.load_checkpoint() is True
-                assert session2.project_name == "checkpoint-test"
-                assert len(session2.completed_loops) == 2
-
-                # Continue with more loops
-                session2.complete_loop("Story Spark")
-                assert len(session2.completed_loops) == 3
-
-            finally:
-                os.chdir(old_cwd)
+        # Initial session - execute loops
+        session1 = checkpoint_session
+        session1.project_name = "checkpoint-test"
+        session1.complete_loop("Hook Harvest")
+        session1.complete_loop("Lore Deepening")
+        session1.save_checkpoint()
+
+        # Resume session - load checkpoint and continue
+        session2 = QuickstartSession()
+        assert session2.load_checkpoint() is True
+        assert session2.project_name == "checkpoint-test"
+        assert len(session2.completed_loops) == 2
+
+        # Continue with more loops
+        session2.complete_loop("Story Spark")
+        assert len(session2.completed_loops) == 3
 
     def test_interactive_mode_workflow(self) -> None:
         """Test interactive mode enablement."""
@@ -381,7 +300,10 @@ class TestQuickstartIntegration:
 class TestQuickstartInteractive:
     """Tests for quickstart command with mocked prompts."""
 
-    def test_quickstart_command_with_mocked_prompts(self) -> None:
+    @pytest.mark.slow
+    def test_quickstart_command_with_mocked_prompts(
+        self, tmp_path, monkeypatch, quickstart_prompts
+    ) -> None:
         """Test quickstart with mocked questionary prompts.
 
         Since questionary requires actual TTY emulation which CliRunner doesn't
@@ -389,126 +311,54 @@ class TestQuickstartInteractive:
         testing approach because we're testing the command's behavior, not
         questionary's behavior.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                # Mock all prompts and _is_interactive for testing environment
-                with patch("qf.interactive.prompts._is_interactive", return_value=True):
-                    with patch(
-                        "qf.commands.quickstart.ask_premise",
-                        return_value="A mysterious tale with twists",
-                    ):
-                        with patch(
-                            "qf.commands.quickstart.ask_tone", return_value="Mystery"
-                        ):
-                            with patch(
-                                "qf.commands.quickstart.ask_length",
-                                return_value="Novella (20-50 pages)",
-                            ):
-                                with patch(
-                                    "qf.commands.quickstart.ask_project_name",
-                                    return_value="mystery-tale",
-                                ):
-                                    with patch(
-                                        "qf.commands.quickstart.confirm_setup",
-                                        return_value=True,
-                                    ):
-                                        with patch(
-                                            "qf.commands.quickstart.ask_review_artifacts",
-                                            return_value=False,
-                                        ):
-                                            with patch(
-                                                "qf.commands.quickstart.ask_continue_loop",
-                                                return_value=True,
-                                            ):
-                                                # Configure environment for terminal
-                                                env = {
-                                                    "TERM": "xterm-256color",
-                                                    "COLUMNS": "200",
-                                                }
-
-                                                result = runner.invoke(
-                                                    app, ["quickstart"], env=env
-                                                )
-
-                # Command should complete successfully
-                assert result.exit_code == 0
-                assert "Quickstart Complete" in result.stdout
-
-                # Project files should be created
-                assert Path(".questfoundry").exists()
-                assert (Path(".questfoundry") / "project.json").exists()
-
-            finally:
-                os.chdir(old_cwd)
-
-    def test_quickstart_fails_without_tty(self) -> None:
-        """Test that quickstart fails when TTY is not available."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
+        monkeypatch.chdir(tmp_path)
+
+        # Configure environment for terminal
+        env = {
+            "TERM": "xterm-256color",
+            "COLUMNS": "200",
+        }
+        result = runner.invoke(app, ["quickstart"], env=env)
+
+        # Command should complete successfully
+        assert result.exit_code == 0
+        assert "Quickstart Complete" in result.stdout
 
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
+        # Project files should be created
+        assert Path(".questfoundry").exists()
+        assert (Path(".questfoundry") / "project.json").exists()
 
-            try:
-                # Don't mock _is_interactive, so it returns False
-                result = runner.invoke(app, ["quickstart"])
+    def test_quickstart_fails_without_tty(self, tmp_path, monkeypatch) -> None:
+        """Test that quickstart fails when TTY is not available."""
+        monkeypatch.chdir(tmp_path)
 
-                # Should fail with clear error
-                assert result.exit_code == 1
-                assert "Interactive mode requires a TTY" in (
-                    result.stdout + str(result.exception)
-                )
+        # Don't mock _is_interactive, so it returns False
+        result = runner.invoke(app, ["quickstart"])
 
-            finally:
-                os.chdir(old_cwd)
+        # Should fail with clear error
+        assert result.exit_code == 1
+        assert "Interactive mode requires a TTY" in (
+            result.stdout + str(result.exception)
+        )
 
-    def test_quickstart_resume_with_checkpoint(self) -> None:
+    @pytest.mark.slow
+    def test_quickstart_resume_with_checkpoint(
+        self, checkpoint_session, quickstart_prompts
+    ) -> None:
         """Test quickstart resume flag with checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-
-            try:
-                # First create a project and checkpoint
-                session = QuickstartSession()
-                session.create_project(
-                    "resume-test",
-                    "Test premise",
-                    "Fantasy",
-                    "Novel",
-                )
-                session.complete_loop("Hook Harvest")
-                session.save_checkpoint()
-
-                # Now test resume with mocked prompts
-                with patch(
-                    "qf.interactive.prompts._is_interactive", return_value=True
-                ):
-                    with patch(
-                        "qf.commands.quickstart.ask_review_artifacts",
-                        return_value=False,
-                    ):
-                        with patch(
-                            "qf.commands.quickstart.ask_continue_loop",
-                            return_value=False,
-                        ):
-                            env = {
-                                "TERM": "xterm-256color",
-                                "COLUMNS": "200",
-                            }
-                            result = runner.invoke(
-                                app, ["quickstart", "--resume"], env=env
-                            )
-
-                assert result.exit_code == 0
-                assert "Resumed from checkpoint" in result.stdout
-
-            finally:
-                os.chdir(old_cwd)
+        # First save a checkpoint; resuming only reads that file
+        session = checkpoint_session
+        session.project_name = "resume-test"
+        session.complete_loop("Hook Harvest")
+        session.save_checkpoint()
+
+        # Now test resume, stopping after the first suggested loop
+        quickstart_prompts["ask_continue_loop"].return_value = False
+        env = {
+            "TERM": "xterm-256color",
+            "COLUMNS": "200",
+        }
+        result = runner.invoke(app, ["quickstart", "--resume"], env=env)
+
+        assert result.exit_code == 0
+        assert "Resumed from checkpoint" in result.stdout
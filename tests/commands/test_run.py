@@ -1,11 +1,13 @@
 """Tests for run command"""
 
 import pytest
-from typer.testing import CliRunner
 
 from qf.cli import app
+from qf.commands.run import run
+from tests.commands.assertions import assert_all_in
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 def test_run_without_project(tmp_path, monkeypatch):
@@ -18,31 +20,18 @@ def test_run_without_project(tmp_path, monkeypatch):
     assert "No project found" in result.stdout
 
 
-def test_run_with_valid_loop(tmp_path, monkeypatch, mock_questionary_init):
+@pytest.mark.slow
+def test_run_with_valid_loop(initialized_project):
     """Test running a valid loop in a project"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # run a loop
-    result = runner.invoke(app, ["run", "hook-harvest"])
+    result = runner.invoke(app, ["run", "hook-harvest"], catch_exceptions=False)
 
     assert result.exit_code == 0
-    assert "Hook Harvest" in result.stdout
-    assert "HH" in result.stdout
-    assert "Summary" in result.stdout
+    assert_all_in(result.stdout, "Hook Harvest", "HH", "Summary")
 
 
-def test_run_with_invalid_loop(tmp_path, monkeypatch, mock_questionary_init):
+def test_run_with_invalid_loop(initialized_project):
     """Test running an invalid loop name"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # try invalid loop
     result = runner.invoke(app, ["run", "invalid-loop"])
 
@@ -51,32 +40,22 @@ def test_run_with_invalid_loop(tmp_path, monkeypatch, mock_questionary_init):
     assert "Available loops" in result.stdout
 
 
-def test_run_with_display_name(tmp_path, monkeypatch, mock_questionary_init):
+@pytest.mark.slow
+def test_run_with_display_name(initialized_project):
     """Test running a loop using display name"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # run using display name
-    result = runner.invoke(app, ["run", "Story Spark"])
+    result = runner.invoke(app, ["run", "Story Spark"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Story Spark" in result.stdout
     assert "SS" in result.stdout
 
 
-def test_run_shows_progress(tmp_path, monkeypatch, mock_questionary_init):
+@pytest.mark.slow
+def test_run_shows_progress(initialized_project):
     """Test that running shows progress indicators"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # run loop
-    result = runner.invoke(app, ["run", "lore-deepening"])
+    result = runner.invoke(app, ["run", "lore-deepening"], catch_exceptions=False)
 
     assert result.exit_code == 0
     # check for activity indicators (iteration-aware output)
@@ -85,16 +64,11 @@ def test_run_shows_progress(tmp_path, monkeypatch, mock_questionary_init):
     assert "Iteration" in result.stdout or "Context initialization" in result.stdout
 
 
-def test_run_shows_summary(tmp_path, monkeypatch, mock_questionary_init):
+@pytest.mark.slow
+def test_run_shows_summary(initialized_project):
     """Test that running shows execution summary"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # run loop
-    result = runner.invoke(app, ["run", "codex-expansion"])
+    result = runner.invoke(app, ["run", "codex-expansion"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Summary" in result.stdout
@@ -107,77 +81,49 @@ def test_run_shows_summary(tmp_path, monkeypatch, mock_questionary_init):
     )
 
 
-def test_run_suggests_next_action(tmp_path, monkeypatch, mock_questionary_init):
+@pytest.mark.slow
+def test_run_suggests_next_action(initialized_project):
     """Test that running suggests next action"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # run hook-harvest (should suggest lore-deepening next)
-    result = runner.invoke(app, ["run", "hook-harvest"])
+    result = runner.invoke(app, ["run", "hook-harvest"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Next Action" in result.stdout or "next" in result.stdout.lower()
 
 
-def test_run_interactive_flag(tmp_path, monkeypatch, mock_questionary_init):
+@pytest.mark.slow
+def test_run_interactive_flag(initialized_project):
     """Test interactive flag shows future message"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # run with interactive flag
-    result = runner.invoke(app, ["run", "story-spark", "--interactive"])
+    result = runner.invoke(
+        app, ["run", "story-spark", "--interactive"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
     assert "Interactive mode" in result.stdout or "future" in result.stdout
 
 
-@pytest.mark.parametrize(
-    "category,loops",
-    [
-        ("discovery", ["story-spark", "hook-harvest", "lore-deepening"]),
-        ("refinement", ["codex-expansion", "style-tuneup"]),
-        ("asset", ["art-touchup", "audio-pass", "translation-pass"]),
-        (
-            "export",
-            [
-                "binding-run",
-                "narration-dry-run",
-                "gatecheck",
-                "post-mortem",
-                "archive-snapshot",
-            ],
-        ),
-    ],
-)
-def test_run_all_loops_by_category(
-    category, loops, tmp_path, monkeypatch, mock_questionary_init
-):
-    """Test all loops in a category execute successfully"""
-    monkeypatch.chdir(tmp_path)
-
-    # initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
-    # test each loop in the category
-    for loop in loops:
-        result = runner.invoke(app, ["run", loop])
-        assert result.exit_code == 0
-        assert "Summary" in result.stdout
-
-
-def test_run_help(tmp_path):
-    """Test run command help text"""
-    result = runner.invoke(app, ["run", "--help"])
-
-    assert result.exit_code == 0
-    assert "Execute a loop" in result.stdout
-    assert "LOOP_NAME" in result.stdout or "loop" in result.stdout.lower()
-    # Check for interactive option (flexible to handle different Rich output formats)
-    assert "interactive" in result.stdout.lower()
+LOOPS = [
+    ("discovery", "story-spark"),
+    ("discovery", "hook-harvest"),
+    ("discovery", "lore-deepening"),
+    ("refinement", "codex-expansion"),
+    ("refinement", "style-tuneup"),
+    ("asset", "art-touchup"),
+    ("asset", "audio-pass"),
+    ("asset", "translation-pass"),
+    ("export", "binding-run"),
+    ("export", "narration-dry-run"),
+    ("export", "gatecheck"),
+    ("export", "post-mortem"),
+    ("export", "archive-snapshot"),
+]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("category,loop", LOOPS)
+def test_run_loop(category, loop, initialized_project, capsys):
+    """Test each loop executes successfully"""
+    # Argument parsing is covered by the other tests; call the command directly
+    run(loop_name=loop, interactive=False)
+    assert "Summary" in capsys.readouterr().out
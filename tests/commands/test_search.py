@@ -1,259 +1,146 @@
 """Tests for artifact search command"""
 
 import json
+import statistics
+import time
 
-from typer.testing import CliRunner
+import pytest
+import typer
 
 from qf.cli import app
-
-runner = CliRunner()
+from qf.commands.search import search_command
+from tests.runner import CachedCliRunner
+
+runner = CachedCliRunner()
+
+
+def hook_json(hook_id, title, **fields):
+    """Serialize a hook artifact to the bytes written under `hot/hooks`"""
+    return json.dumps(
+        {"id": hook_id, "type": "hook", "title": title, **fields}
+    ).encode()
+
+
+SEARCH_HOOKS = {
+    "hook-001": hook_json(
+        "hook-001",
+        "Dragon Discovery",
+        content="A hidden dragon awakens in the mountains",
+    ),
+    "hook-002": hook_json(
+        "hook-002", "Dragon's Lair", content="Finding the dragon's hidden cave"
+    ),
+    "hook-003": hook_json(
+        "hook-003", "Test Case", content="The test here is important"
+    ),
+}
+TEST_HOOK = hook_json("hook-001", "Test Hook")
+TEST_LOOP = json.dumps(
+    {"id": "loop-001", "type": "loop", "title": "Test Loop"}
+).encode()
+IMPORTANT_HOOK = hook_json("hook-001", "Important Hook", content="Irrelevant content")
+NUMBERED_HOOKS = {
+    f"hook-{i:03d}": hook_json(f"hook-{i:03d}", f"Test Hook {i}") for i in range(5)
+}
+LONG_HOOKS = {
+    f"hook-{i:03d}": hook_json(
+        f"hook-{i:03d}", f"Test Hook {i}", content="Some content " * 100
+    )
+    for i in range(10)
+}
+
+
+@pytest.fixture
+def search_project(hooks_workspace):
+    """Project with a few hooks for the query tests to match against"""
+    hot_dir = hooks_workspace / ".questfoundry" / "hot" / "hooks"
+    for hook_id, data in SEARCH_HOOKS.items():
+        (hot_dir / f"{hook_id}.json").write_bytes(data)
+    return hooks_workspace
 
 
 class TestSearchCommand:
     """Tests for basic search command functionality"""
 
-    def test_search_help(self):
-        """Test search help is available"""
-        result = runner.invoke(app, ["search", "--help"])
-        assert result.exit_code == 0
-        assert "search" in result.stdout.lower()
-
-    def test_search_no_project(self, tmp_path, monkeypatch):
+    def test_search_no_project(self, tmp_path, monkeypatch, capsys):
         """Test search fails without project"""
         monkeypatch.chdir(tmp_path)
-        result = runner.invoke(app, ["search", "test"])
-        assert result.exit_code != 0
-        assert "no project" in result.stdout.lower()
+        with pytest.raises(typer.Exit) as exc_info:
+            search_command("test", type_filter=None, field=None, limit=50)
+        assert exc_info.value.exit_code != 0
+        assert "no project" in capsys.readouterr().out.lower()
 
-    def test_search_no_results(self, tmp_path, monkeypatch):
+    def test_search_no_results(self, hooks_workspace):
         """Test search with no matching results"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
-        # Create artifact workspace but no artifacts
-        (tmp_path / ".questfoundry" / "hot" / "test").mkdir(parents=True, exist_ok=True)
-
         result = runner.invoke(app, ["search", "nonexistent-query"])
         assert result.exit_code == 0
         # Should show "no results" or similar
         assert "no results" in result.stdout.lower() or len(result.stdout.strip()) == 0
 
-    def test_search_single_result(self, tmp_path, monkeypatch):
-        """Test search with single matching result"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
-        # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
-        artifact_data = {
-            "id": "hook-001",
-            "type": "hook",
-            "title": "Dragon Discovery",
-            "content": "A hidden dragon awakens in the mountains",
-        }
-        (hot_dir / "hook-001.json").write_text(json.dumps(artifact_data))
-
-        result = runner.invoke(app, ["search", "dragon"])
-        assert result.exit_code == 0
-        assert "hook-001" in result.stdout or "dragon" in result.stdout.lower()
-
-    def test_search_multiple_results(self, tmp_path, monkeypatch):
-        """Test search with multiple matching results"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
-        # Create multiple artifacts
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
-        hook1 = {
-            "id": "hook-001",
-            "type": "hook",
-            "title": "Dragon Discovery",
-            "content": "A dragon appears",
-        }
-        (hot_dir / "hook-001.json").write_text(json.dumps(hook1))
-
-        hook2 = {
-            "id": "hook-002",
-            "type": "hook",
-            "title": "Dragon's Lair",
-            "content": "Finding the dragon's hidden cave",
-        }
-        (hot_dir / "hook-002.json").write_text(json.dumps(hook2))
-
-        result = runner.invoke(app, ["search", "dragon"])
+    @pytest.mark.parametrize(
+        "query,expected_ids",
+        [
+            ("mountains", ["hook-001"]),
+            ("dragon", ["hook-001", "hook-002"]),
+            ("DRAGON", ["hook-001", "hook-002"]),
+            ("test", ["hook-003"]),
+        ],
+        ids=["single", "multiple", "case-insensitive", "title-highlight"],
+    )
+    def test_search_matches(self, search_project, query, expected_ids):
+        """Test search lists every matching artifact in the results table"""
+        result = runner.invoke(app, ["search", query], catch_exceptions=False)
         assert result.exit_code == 0
-        # Should find at least one result
-        assert "hook" in result.stdout.lower() or "dragon" in result.stdout.lower()
-
-    def test_search_case_insensitive(self, tmp_path, monkeypatch):
-        """Test search is case-insensitive"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
-        # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
-        artifact_data = {
-            "id": "hook-001",
-            "type": "hook",
-            "title": "Dragon Discovery",
-            "content": "uppercase text here",
-        }
-        (hot_dir / "hook-001.json").write_text(json.dumps(artifact_data))
-
-        # Search with different cases
-        result_lower = runner.invoke(app, ["search", "dragon"])
-        result_upper = runner.invoke(app, ["search", "DRAGON"])
-
-        assert result_lower.exit_code == 0
-        assert result_upper.exit_code == 0
+        assert f"Search Results: {query}" in result.stdout
+        for artifact_id in expected_ids:
+            assert artifact_id in result.stdout
+        assert f"Found {len(expected_ids)} result" in result.stdout
 
 
 class TestSearchOptions:
     """Tests for search command options"""
 
-    def test_search_type_filter(self, tmp_path, monkeypatch):
+    def test_search_type_filter(self, hooks_workspace):
         """Test search with type filter"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create different artifact types
-        hooks_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hooks_dir.mkdir(parents=True, exist_ok=True)
-
-        loops_dir = tmp_path / ".questfoundry" / "hot" / "loops"
-        loops_dir.mkdir(parents=True, exist_ok=True)
-
-        hook_data = {
-            "id": "hook-001",
-            "type": "hook",
-            "title": "Test Hook",
-        }
-        (hooks_dir / "hook-001.json").write_text(json.dumps(hook_data))
-
-        loop_data = {
-            "id": "loop-001",
-            "type": "loop",
-            "title": "Test Loop",
-        }
-        (loops_dir / "loop-001.json").write_text(json.dumps(loop_data))
+        hooks_dir = hooks_workspace / ".questfoundry" / "hot" / "hooks"
+        loops_dir = hooks_workspace / ".questfoundry" / "hot" / "loops"
+        (hooks_dir / "hook-001.json").write_bytes(TEST_HOOK)
+        (loops_dir / "loop-001.json").write_bytes(TEST_LOOP)
 
         result = runner.invoke(app, ["search", "test", "--type", "hook"])
         assert result.exit_code == 0
         # Should filter to hooks only
         assert "hook" in result.stdout.lower()
 
-    def test_search_field_filter(self, tmp_path, monkeypatch):
+    def test_search_field_filter(self, hooks_workspace):
         """Test search in specific field"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
+        hot_dir = hooks_workspace / ".questfoundry" / "hot" / "hooks"
 
-        artifact_data = {
-            "id": "hook-001",
-            "type": "hook",
-            "title": "Important Hook",
-            "content": "Irrelevant content",
-        }
-        (hot_dir / "hook-001.json").write_text(json.dumps(artifact_data))
+        (hot_dir / "hook-001.json").write_bytes(IMPORTANT_HOOK)
 
         result = runner.invoke(app, ["search", "important", "--field", "title"])
         assert result.exit_code == 0
 
-    def test_search_limit_results(self, tmp_path, monkeypatch):
+    def test_search_limit_results(self, hooks_workspace):
         """Test search with result limit"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
         # Create multiple artifacts
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
+        hot_dir = hooks_workspace / ".questfoundry" / "hot" / "hooks"
 
-        for i in range(5):
-            artifact_data = {
-                "id": f"hook-{i:03d}",
-                "type": "hook",
-                "title": f"Test Hook {i}",
-            }
-            (hot_dir / f"hook-{i:03d}.json").write_text(json.dumps(artifact_data))
+        for hook_id, data in NUMBERED_HOOKS.items():
+            (hot_dir / f"{hook_id}.json").write_bytes(data)
 
         result = runner.invoke(app, ["search", "test", "--limit", "2"])
         assert result.exit_code == 0
         # Output should be limited (implementation dependent)
 
 
-class TestSearchCompletion:
-    """Tests for search command completion"""
-
-    def test_search_command_has_completion(self):
-        """Test search command is available with tab completion"""
-        result = runner.invoke(app, ["search", "--help"])
-        assert result.exit_code == 0
-
-
 class TestSearchOutput:
     """Tests for search output formatting"""
 
-    def test_search_results_display_format(self, tmp_path, monkeypatch):
-        """Test search results are displayed in table format"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
-        # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
-        artifact_data = {
-            "id": "hook-001",
-            "type": "hook",
-            "title": "Dragon Discovery",
-            "content": "A dragon appears",
-        }
-        (hot_dir / "hook-001.json").write_text(json.dumps(artifact_data))
-
-        result = runner.invoke(app, ["search", "dragon"])
-        assert result.exit_code == 0
-        # Should contain artifact information
-        output = result.stdout.lower()
-        assert any(word in output for word in ["hook-001", "dragon", "hook"])
-
-    def test_search_highlights_matches(self, tmp_path, monkeypatch):
-        """Test search highlights matching terms in results"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
-        # Create artifact
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
-        artifact_data = {
-            "id": "hook-001",
-            "type": "hook",
-            "title": "Test Case",
-            "content": "The test here is important",
-        }
-        (hot_dir / "hook-001.json").write_text(json.dumps(artifact_data))
-
-        result = runner.invoke(app, ["search", "test"])
-        assert result.exit_code == 0
-        # Should contain the search term
-        assert "test" in result.stdout.lower()
-
-    def test_search_empty_results_message(self, tmp_path, monkeypatch):
+    def test_search_empty_results_message(self, hooks_workspace):
         """Test search shows helpful message when no results"""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
-
-        (tmp_path / ".questfoundry").mkdir(parents=True, exist_ok=True)
-
         result = runner.invoke(app, ["search", "xyz123nonexistent"])
         assert result.exit_code == 0
         # Should indicate no results found
@@ -265,29 +152,23 @@ class TestSearchOutput:
 class TestSearchPerformance:
     """Tests for search performance"""
 
-    def test_search_completes_quickly(self, tmp_path, monkeypatch):
-        """Test search completes within reasonable time"""
-        import time
+    def test_search_completes_quickly(self, hooks_workspace):
+        """Test warm search runs stay within a reasonable time"""
+        # Create multiple artifacts
+        hot_dir = hooks_workspace / ".questfoundry" / "hot" / "hooks"
 
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".qfproj").write_text("{}")
+        for hook_id, data in LONG_HOOKS.items():
+            (hot_dir / f"{hook_id}.json").write_bytes(data)
 
-        # Create multiple artifacts
-        hot_dir = tmp_path / ".questfoundry" / "hot" / "hooks"
-        hot_dir.mkdir(parents=True, exist_ok=True)
-
-        for i in range(10):
-            artifact_data = {
-                "id": f"hook-{i:03d}",
-                "type": "hook",
-                "title": f"Test Hook {i}",
-                "content": "Some content " * 100,
-            }
-            (hot_dir / f"hook-{i:03d}.json").write_text(json.dumps(artifact_data))
-
-        start = time.time()
+        # Warm up once so imports and first-call setup are not timed
         result = runner.invoke(app, ["search", "test"])
-        elapsed = time.time() - start
-
         assert result.exit_code == 0
-        assert elapsed < 2.0  # Should complete in under 2 seconds
+
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            runner.invoke(app, ["search", "test"])
+            timings.append(time.perf_counter() - start)
+
+        # The median ignores one-off scheduler hiccups
+        assert statistics.median(timings) < 0.5
@@ -1,24 +1,27 @@
 """Tests for qf show command"""
 
-
-from typer.testing import CliRunner
+import pytest
+import typer
 
 from qf.cli import app
+from qf.commands.show import show_artifact
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
-def test_show_fails_without_project(tmp_path, monkeypatch):
+def test_show_fails_without_project(tmp_path, monkeypatch, capsys):
     """Test that show fails when no project exists"""
     # Change to temp directory
     monkeypatch.chdir(tmp_path)
 
-    # Run show command
-    result = runner.invoke(app, ["show", "test-artifact"])
+    # No argv to parse here; call the command directly
+    with pytest.raises(typer.Exit) as exc_info:
+        show_artifact("test-artifact")
 
     # Should fail
-    assert result.exit_code == 1
-    assert "No project found" in result.stdout
+    assert exc_info.value.exit_code == 1
+    assert "No project found" in capsys.readouterr().out
 
 
 def test_show_fails_with_nonexistent_artifact(tmp_path, monkeypatch):
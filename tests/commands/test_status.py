@@ -2,11 +2,14 @@
 
 import json
 
-from typer.testing import CliRunner
+import pytest
+import typer
 
 from qf.cli import app
+from qf.commands.status import status_command
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 def test_status_shows_project_info(tmp_path, monkeypatch):
@@ -37,14 +40,15 @@ def test_status_shows_project_info(tmp_path, monkeypatch):
     assert "Test description" in result.stdout
 
 
-def test_status_fails_without_project(tmp_path, monkeypatch):
+def test_status_fails_without_project(tmp_path, monkeypatch, capsys):
     """Test that status fails when no project exists"""
     # Change to temp directory
     monkeypatch.chdir(tmp_path)
 
-    # Run status command
-    result = runner.invoke(app, ["status"])
+    # No argv to parse here; call the command directly
+    with pytest.raises(typer.Exit) as exc_info:
+        status_command()
 
     # Should fail
-    assert result.exit_code == 1
-    assert "No project found" in result.stdout
+    assert exc_info.value.exit_code == 1
+    assert "No project found" in capsys.readouterr().out
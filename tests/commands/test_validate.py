@@ -2,54 +2,27 @@
 
 import json
 
-from typer.testing import CliRunner
+import pytest
+import typer
 
 from qf.cli import app
+from qf.commands import validate
+from qf.commands.validate import (
+    get_validator,
+    validate_all,
+    validate_artifact,
+    validate_envelope,
+    validate_file,
+)
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
-def test_validate_file_with_valid_artifact(tmp_path):
+def test_validate_file_with_valid_artifact(tmp_path, codex_entry_bytes):
     """Test validating a valid artifact file"""
-    # Create a valid codex entry
-    artifact = {
-        "title": "Test Entry",
-        "slug": "test-entry",
-        "locale": "EN",
-        "owner": "Codex Curator",
-        "edited": "2025-11-07",
-        "snapshot": "Cold @ 2025-11-04",
-        "tu": "TU-2025-11-07-CC01",
-        "lineage": "From canon TU-2025-11-03-LW10; posture plausible",
-        "overview": "A test codex entry for validation testing purposes",
-        "context": "This entry is used to validate the schema validation system",
-        "variants": [
-            {
-                "variant": "Test Variant",
-                "register_region": "neutral",
-                "translator_notes": "Translation note for testing"
-            }
-        ],
-        "relations": ["test-relation"],
-        "reading_level": "plain",
-        "anchor_slug": "/codex/test-entry",
-        "from_canon": "Test canon description for validation",
-        "research_posture_touched": "plausible",
-        "done_checklist": [
-            "Player-safe",
-            "Links resolve",
-            "Variants listed",
-            "Relations noted",
-            "Register chosen",
-            "Anchor set",
-            "Canon distilled",
-            "Posture logged"
-        ]
-    }
-
     artifact_file = tmp_path / "test_entry.json"
-    with open(artifact_file, "w") as f:
-        json.dump(artifact, f)
+    artifact_file.write_bytes(codex_entry_bytes)
 
     # Validate
     result = runner.invoke(
@@ -61,7 +34,20 @@ def test_validate_file_with_valid_artifact(tmp_path):
     assert "valid" in result.stdout.lower()
 
 
-def test_validate_file_with_invalid_artifact(tmp_path):
+def test_validate_file_from_stdin(codex_entry_bytes):
+    """Test validating an artifact read from stdin"""
+    result = runner.invoke(
+        app,
+        ["validate", "file", "-", "--schema", "codex_entry"],
+        input=codex_entry_bytes,
+    )
+
+    assert result.exit_code == 0
+    assert "✓" in result.stdout
+    assert "valid" in result.stdout.lower()
+
+
+def test_validate_file_with_invalid_artifact():
     """Test validating an invalid artifact file"""
     # Create an invalid codex entry (missing required fields)
     artifact = {
@@ -70,13 +56,11 @@ def test_validate_file_with_invalid_artifact(tmp_path):
         # Missing many required fields like locale, owner, edited, etc.
     }
 
-    artifact_file = tmp_path / "test_entry.json"
-    with open(artifact_file, "w") as f:
-        json.dump(artifact, f)
-
     # Validate
     result = runner.invoke(
-        app, ["validate", "file", str(artifact_file), "--schema", "codex_entry"]
+        app,
+        ["validate", "file", "-", "--schema", "codex_entry"],
+        input=json.dumps(artifact),
     )
 
     assert result.exit_code == 1
@@ -84,98 +68,46 @@ def test_validate_file_with_invalid_artifact(tmp_path):
     assert "failed" in result.stdout.lower()
 
 
-def test_validate_file_nonexistent(tmp_path):
+def test_validate_file_nonexistent(tmp_path, capsys):
     """Test validating a nonexistent file"""
-    result = runner.invoke(
-        app,
-        [
-            "validate",
-            "file",
-            str(tmp_path / "nonexistent.json"),
-            "--schema",
-            "codex_entry",
-        ],
-    )
+    with pytest.raises(typer.Exit) as exc_info:
+        validate_file(tmp_path / "nonexistent.json", schema="codex_entry")
 
-    assert result.exit_code == 1
-    assert "not found" in result.stdout.lower()
+    assert exc_info.value.exit_code == 1
+    assert "not found" in capsys.readouterr().out.lower()
 
 
-def test_validate_file_invalid_json(tmp_path):
+def test_validate_file_invalid_json(tmp_path, capsys):
     """Test validating a file with invalid JSON"""
     artifact_file = tmp_path / "invalid.json"
     with open(artifact_file, "w") as f:
         f.write("{invalid json")
 
-    result = runner.invoke(
-        app, ["validate", "file", str(artifact_file), "--schema", "codex_entry"]
-    )
+    with pytest.raises(typer.Exit) as exc_info:
+        validate_file(artifact_file, schema="codex_entry")
 
-    assert result.exit_code == 1
-    assert "json" in result.stdout.lower()
+    assert exc_info.value.exit_code == 1
+    assert "json" in capsys.readouterr().out.lower()
 
 
-def test_validate_artifact_not_in_project(tmp_path, monkeypatch):
+def test_validate_artifact_not_in_project(tmp_path, monkeypatch, capsys):
     """Test validating artifact without a project"""
     monkeypatch.chdir(tmp_path)
 
-    result = runner.invoke(app, ["validate", "artifact", "test-artifact"])
+    with pytest.raises(typer.Exit) as exc_info:
+        validate_artifact("test-artifact")
 
-    assert result.exit_code == 1
-    assert "No project found" in result.stdout
+    assert exc_info.value.exit_code == 1
+    assert "No project found" in capsys.readouterr().out
 
 
-def test_validate_artifact_in_project(tmp_path, monkeypatch, mock_questionary_init):
+def test_validate_artifact_in_project(initialized_project, codex_entry_bytes):
     """Test validating an artifact in a project"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
-    # Create a valid codex entry in workspace
-    workspace = tmp_path / ".questfoundry"
+    # Create a valid codex entry in workspace; its type drives schema detection
+    workspace = initialized_project / ".questfoundry"
     codex_dir = workspace / "hot" / "codex"
     codex_dir.mkdir(parents=True, exist_ok=True)
-
-    artifact = {
-        "type": "codex_entry",  # add type for auto-detection
-        "title": "Test Entry",
-        "slug": "test-entry",
-        "locale": "EN",
-        "owner": "Codex Curator",
-        "edited": "2025-11-07",
-        "snapshot": "Cold @ 2025-11-04",
-        "tu": "TU-2025-11-07-CC01",
-        "lineage": "From canon TU-2025-11-03-LW10; posture plausible",
-        "overview": "A test codex entry for validation testing purposes",
-        "context": "This entry is used to validate the schema validation system",
-        "variants": [
-            {
-                "variant": "Test Variant",
-                "register_region": "neutral",
-                "translator_notes": "Translation note for testing"
-            }
-        ],
-        "relations": ["test-relation"],
-        "reading_level": "plain",
-        "anchor_slug": "/codex/test-entry",
-        "from_canon": "Test canon description for validation",
-        "research_posture_touched": "plausible",
-        "done_checklist": [
-            "Player-safe",
-            "Links resolve",
-            "Variants listed",
-            "Relations noted",
-            "Register chosen",
-            "Anchor set",
-            "Canon distilled",
-            "Posture logged"
-        ]
-    }
-
-    with open(codex_dir / "test-entry.json", "w") as f:
-        json.dump(artifact, f)
+    (codex_dir / "test-entry.json").write_bytes(codex_entry_bytes)
 
     # Validate (schema should be auto-detected from type field)
     result = runner.invoke(app, ["validate", "artifact", "test-entry"])
@@ -185,18 +117,10 @@ def test_validate_artifact_in_project(tmp_path, monkeypatch, mock_questionary_in
     assert "valid" in result.stdout.lower()
 
 
-def test_validate_artifact_missing_type_field(
-    tmp_path, monkeypatch, mock_questionary_init
-):
+def test_validate_artifact_missing_type_field(initialized_project):
     """Test validating artifact without type field and no schema specified"""
-    monkeypatch.chdir(tmp_path)
-
-    # Initialize project
-    result = runner.invoke(app, ["init"])
-    assert result.exit_code == 0
-
     # Create artifact without type field
-    workspace = tmp_path / ".questfoundry"
+    workspace = initialized_project / ".questfoundry"
     hooks_dir = workspace / "hot" / "hooks"
     hooks_dir.mkdir(parents=True, exist_ok=True)
 
@@ -216,11 +140,80 @@ def test_validate_artifact_missing_type_field(
     assert "no 'type' field" in result.stdout.lower()
 
 
-def test_validate_envelope_shows_coming_soon(tmp_path):
+def test_validator_is_built_once_per_schema(tmp_path, monkeypatch, request):
+    """Test repeated validations reuse the compiled schema"""
+    schema = {"type": "object", "required": ["id"]}
+    (tmp_path / "probe.schema.json").write_text(json.dumps(schema))
+    monkeypatch.setattr(validate, "get_schemas_path", lambda: tmp_path)
+    get_validator.cache_clear()
+    request.addfinalizer(get_validator.cache_clear)
+
+    assert validate.validate_artifact_data({"id": "x"}, "probe") == (True, [])
+    assert validate.validate_artifact_data({}, "probe") == (
+        False,
+        ["root: 'id' is a required property"],
+    )
+    assert get_validator.cache_info().misses == 1
+    assert get_validator("probe") is get_validator("probe")
+
+
+@pytest.fixture
+def hook_schema(initialized_project, monkeypatch, request):
+    """Serve a single `hook` schema requiring `id` and `title`"""
+    schemas = initialized_project / "schemas"
+    schemas.mkdir()
+    schema = {"type": "object", "required": ["id", "title"]}
+    (schemas / "hook.schema.json").write_text(json.dumps(schema))
+    monkeypatch.setattr(validate, "get_schemas_path", lambda: schemas)
+    get_validator.cache_clear()
+    request.addfinalizer(get_validator.cache_clear)
+
+
+def test_validate_all_summarizes_workspace(initialized_project, hook_schema, capsys):
+    """Test validating every artifact in the workspace at once"""
+    hooks_dir = initialized_project / ".questfoundry" / "hot" / "hooks"
+    archive_dir = hooks_dir / "archive"
+    archive_dir.mkdir(parents=True)
+    for i, directory in enumerate([hooks_dir, hooks_dir, archive_dir], start=1):
+        hook = {"id": f"hook-00{i}", "type": "hook", "title": f"Hook {i}"}
+        (directory / f"hook-00{i}.json").write_text(json.dumps(hook))
+    (hooks_dir / "hook-004.json").write_text('{"id": "hook-004", "type": "hook"}')
+
+    with pytest.raises(typer.Exit) as exc_info:
+        validate_all()
+
+    assert exc_info.value.exit_code == 1
+    output = capsys.readouterr().out
+    assert "3 valid, 1 invalid" in output
+    assert "hooks/hook-004.json" in output
+    assert "'title' is a required property" in output
+
+
+def test_validate_all_reports_unvalidatable_artifacts(
+    initialized_project, hook_schema, capsys
+):
+    """Test artifacts with an unknown or missing type count as invalid"""
+    hooks_dir = initialized_project / ".questfoundry" / "hot" / "hooks"
+    # Sorted first, so nothing from an earlier artifact carries over
+    (hooks_dir / "a-unknown.json").write_text('{"id": "a", "type": "mystery"}')
+    (hooks_dir / "b-untyped.json").write_text('{"id": "b", "title": "B"}')
+    (hooks_dir / "c-valid.json").write_text('{"id": "c", "type": "hook", "title": "C"}')
+
+    with pytest.raises(typer.Exit) as exc_info:
+        validate_all()
+
+    assert exc_info.value.exit_code == 1
+    output = capsys.readouterr().out
+    assert "1 valid, 2 invalid" in output
+    assert "Schema not found: mystery" in output
+    assert "No 'type' field" in output
+
+
+def test_validate_envelope_shows_coming_soon(tmp_path, capsys):
     """Test that envelope validation shows coming soon message"""
     artifact_file = tmp_path / "envelope.json"
     artifact_file.touch()
 
-    result = runner.invoke(app, ["validate", "envelope", str(artifact_file)])
+    validate_envelope(artifact_file)
 
-    assert "coming soon" in result.stdout.lower()
+    assert "coming soon" in capsys.readouterr().out.lower()
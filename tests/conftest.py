@@ -0,0 +1,14 @@
+"""Session-wide test setup"""
+
+import os
+
+import pytest
+
+# Have Rich render plain text at a fixed width, even where FORCE_COLOR is set.
+# Commands build their consoles when `qf` is first imported, so this lives at
+# the top of the root conftest, which pytest imports before any other.
+os.environ.update(NO_COLOR="1", TERM="dumb", COLUMNS="80")
+
+# Shared assertion helpers live outside test modules, so opt them into
+# pytest's assertion rewriting for detailed failure reports
+pytest.register_assert_rewrite("tests.commands.assertions")
@@ -1,8 +1,9 @@
 """Tests for loop iteration progress tracking."""
 
 from datetime import datetime, timedelta
-from time import sleep
+from itertools import count
 
+from qf.formatting import loop_progress
 from qf.formatting.loop_progress import Iteration, LoopProgressTracker, Step
 
 
@@ -78,6 +79,13 @@ class TestIteration:
         assert iteration.revised_steps == 1
         # step1 and step3 are not revisions (first-pass steps)
         assert iteration.first_pass_steps == 2
+        # The single-pass tally agrees with the individual properties
+        assert iteration.step_counts() == {
+            "completed_steps": 2,
+            "blocked_steps": 1,
+            "revised_steps": 1,
+            "first_pass_steps": 2,
+        }
 
 
 class TestLoopProgressTracker:
@@ -91,8 +99,17 @@ class TestLoopProgressTracker:
         assert len(tracker.iterations) == 0
         assert not tracker.is_multi_iteration
 
-    def test_single_iteration_execution(self) -> None:
+    def test_single_iteration_execution(self, monkeypatch) -> None:
         """Test tracking a single-iteration loop."""
+        # Each clock read advances 10ms, standing in for real work
+        start = datetime(2024, 1, 1)
+        ticks = count()
+        monkeypatch.setattr(
+            loop_progress,
+            "_now",
+            lambda: start + timedelta(milliseconds=10 * next(ticks)),
+        )
+
         tracker = LoopProgressTracker(loop_name="Hook Harvest")
         tracker.start_loop()
 
@@ -100,7 +117,6 @@ class TestLoopProgressTracker:
         assert iteration.iteration_number == 1
 
         step1 = tracker.start_step("Analysis", "Lore Weaver")
-        sleep(0.01)  # Simulate work
         tracker.complete_step(step1)
 
         tracker.mark_stabilized()
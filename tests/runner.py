@@ -0,0 +1,23 @@
+"""CliRunner that converts each Typer app to a Click command only once"""
+
+from functools import cache
+
+import typer
+from click.testing import CliRunner
+
+
+@cache
+def get_command(app):
+    """Build the Click command tree for a Typer app, once per app"""
+    return typer.main.get_command(app)
+
+
+class CachedCliRunner(CliRunner):
+    """Drop-in for `typer.testing.CliRunner` that reuses the built command.
+
+    Typer's runner rebuilds the whole Click command tree on every `invoke`,
+    which costs several times more than running a simple command.
+    """
+
+    def invoke(self, app, *args, **kwargs):
+        return super().invoke(get_command(app), *args, **kwargs)
@@ -1,10 +1,12 @@
 """Tests for CLI main functionality"""
 
-from typer.testing import CliRunner
+import subprocess
+import sys
 
 from qf.cli import app
+from tests.runner import CachedCliRunner
 
-runner = CliRunner()
+runner = CachedCliRunner()
 
 
 def test_version():
@@ -20,3 +22,17 @@ def test_help():
     assert result.exit_code == 0
     assert "schema" in result.stdout
     assert "validate" in result.stdout
+
+
+def test_cli_import_defers_heavy_backends():
+    """Test importing the CLI leaves the heavy backends unloaded"""
+    # A fresh interpreter, since other tests import them into this process
+    code = (
+        "import sys, qf.cli; "
+        "heavy = {'jsonschema', 'questionary', 'questfoundry'}; "
+        "print(sorted(heavy & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"